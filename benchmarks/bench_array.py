@@ -0,0 +1,47 @@
+"""Compare `Env.array` against `Env.list(..., subcast=int)`.
+
+Run with `python benchmarks/bench_array.py`.
+"""
+
+from collections.abc import Callable
+import timeit
+import tracemalloc
+
+from typenv import Env
+
+
+def _memory(func: Callable[[], object]) -> tuple[int, int]:
+    """Return memory retained by the result of `func` and peak memory."""
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main() -> None:
+    for count in (1_000, 100_000):
+        env = Env(
+            source={
+                "WEIGHTS": ",".join(str(i) for i in range(count)),
+                "SHARDS": f"0-{count - 1}",
+            }
+        )
+        number = max(1, 1_000_000 // count)
+        cases = {
+            "list(subcast=int)": lambda: env.list("WEIGHTS", subcast=int),  # noqa: B023
+            "array": lambda: env.array("WEIGHTS"),  # noqa: B023
+            "array (range)": lambda: env.array("SHARDS"),  # noqa: B023
+        }
+        for label, func in cases.items():
+            total = timeit.timeit(func, number=number)
+            retained, peak = _memory(func)
+            print(
+                f"{count:>7} items  {label:<18} {total / number * 1e3:8.3f} ms"
+                f"  retained {retained / 1024:8.1f} KiB  peak {peak / 1024:8.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
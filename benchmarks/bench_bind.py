@@ -0,0 +1,67 @@
+"""Compare `Env.bind` against hand-written typecast method calls and
+`Env.load` with a compiled schema.
+
+Run with `python benchmarks/bench_bind.py`.
+"""
+
+import dataclasses
+import timeit
+
+from typenv import Env, Var
+
+
+@dataclasses.dataclass
+class Settings:
+    name: str
+    port: int
+    debug: bool
+    ratio: float
+    hosts: list[str]
+    workers: int = 4
+    log_level: str = "info"
+
+
+def _by_hand(env: Env) -> Settings:
+    return Settings(
+        name=env.str("NAME"),
+        port=env.int("PORT"),
+        debug=env.bool("DEBUG"),
+        ratio=env.float("RATIO"),
+        hosts=env.list("HOSTS"),
+        workers=env.int("WORKERS", default=4),
+        log_level=env.str("LOG_LEVEL", default="info"),
+    )
+
+
+def main() -> None:
+    env = Env(
+        source={"NAME": "app", "PORT": "80", "DEBUG": "true", "RATIO": "0.5", "HOSTS": "a,b"}
+    )
+    schema = env.compile(
+        {
+            "NAME": "str",
+            "PORT": "int",
+            "DEBUG": "bool",
+            "RATIO": "float",
+            "HOSTS": "list",
+            "WORKERS": Var("int", default=4),
+            "LOG_LEVEL": Var("str", default="info"),
+        }
+    )
+    number = 50_000
+    namespace = {**globals(), "env": env, "schema": schema}
+    results = {
+        "by hand": timeit.timeit("_by_hand(env)", globals=namespace, number=number),
+        "load": timeit.timeit(
+            "Settings(**{k.lower(): v for k, v in env.load(schema).items()})",
+            globals=namespace,
+            number=number,
+        ),
+        "bind": timeit.timeit("env.bind(Settings)", globals=namespace, number=number),
+    }
+    for label, total in results.items():
+        print(f"{label:<8} {total / number * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
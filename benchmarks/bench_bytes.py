@@ -0,0 +1,48 @@
+"""Measure `Env.bytes` decoding for 1 KB to 1 MB payloads.
+
+Run with `python benchmarks/bench_bytes.py`.
+"""
+
+import base64
+import os
+import timeit
+
+from typenv import Env
+
+
+def _legacy_hex(value: str) -> bytes:
+    """The hex decoding of typenv 0.2.0, for comparison."""
+    value = value.lower().removeprefix("0x")
+    if len(value) % 2:
+        value = "0" + value
+    return bytes.fromhex(value)
+
+
+def main() -> None:
+    for size in (1024, 64 * 1024, 1024 * 1024):
+        payload = os.urandom(size)
+        env = Env(
+            source={
+                "HEX": "0x" + payload.hex(),
+                "BASE64": base64.b64encode(payload).decode(),
+                "BASE64URL": base64.urlsafe_b64encode(payload).decode().rstrip("="),
+                "BASE85": base64.b85encode(payload).decode(),
+            }
+        )
+        number = max(1, 10 * 1024 * 1024 // size)
+        cases = {
+            "hex (0.2.0)": lambda: _legacy_hex(env.str("HEX")),  # noqa: B023
+            "hex": lambda: env.bytes("HEX", encoding="hex"),  # noqa: B023
+            "hex, mutable": lambda: env.bytes("HEX", encoding="hex", mutable=True),  # noqa: B023
+            "base64": lambda: env.bytes("BASE64", encoding="base64"),  # noqa: B023
+            "base64url": lambda: env.bytes("BASE64URL", encoding="base64url"),  # noqa: B023
+            "base85": lambda: env.bytes("BASE85", encoding="base85"),  # noqa: B023
+        }
+        for label, func in cases.items():
+            assert func() == payload
+            total = timeit.timeit(func, number=number)
+            print(f"{size // 1024:>5} KiB  {label:<13} {total / number * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare a cold `Env.load` against one served from `cache_dir`.
+
+Each iteration creates a new `Env`, as a restarted process would. The
+"cheap" variables are short integers and lists. The "heavy" variables
+are JSON routing tables checked by a validator.
+
+Run with `python benchmarks/bench_cache.py`.
+"""
+
+from collections.abc import Callable
+import json
+import re
+import shutil
+import tempfile
+import timeit
+
+from typenv import Env, Var
+
+_UPSTREAM = re.compile(r"[a-z][a-z0-9-]*:[0-9]{2,5}")
+
+
+def _valid_routes(routes: dict) -> bool:
+    return all(_UPSTREAM.fullmatch(route["upstream"]) for route in routes.values())
+
+
+def _cheap(count: int) -> tuple[dict[str, str], dict[str, Var]]:
+    source = {}
+    spec = {}
+    for i in range(count):
+        source[f"INT_{i}"] = str(i)
+        source[f"LIST_{i}"] = ",".join(str(j) for j in range(20))
+        spec[f"INT_{i}"] = Var("int", validate=lambda v: v >= 0)
+        spec[f"LIST_{i}"] = Var("list", subcast=int)
+    return source, spec
+
+
+def _heavy(count: int) -> tuple[dict[str, str], dict[str, Var]]:
+    routes = {
+        f"/api/v1/resource_{i}": {"upstream": f"service-{i % 50}:8080", "weight": i % 7}
+        for i in range(500)
+    }
+    source = {f"ROUTES_{i}": json.dumps(routes) for i in range(count)}
+    spec = {name: Var("json", validate=_valid_routes) for name in source}
+    return source, spec
+
+
+def main() -> None:
+    workloads: dict[str, Callable[[int], tuple[dict[str, str], dict[str, Var]]]] = {
+        "cheap": _cheap,
+        "heavy": _heavy,
+    }
+    for workload, make in workloads.items():
+        for count in (10, 100):
+            source, spec = make(count)
+            cache_dir = tempfile.mkdtemp()
+            number = max(1, 1_000 // count)
+            namespace = {"Env": Env, "shutil": shutil, **locals()}
+            results = {
+                "no cache": timeit.timeit(
+                    "Env(source=source).load(spec)", globals=namespace, number=number
+                ),
+                "cold cache": timeit.timeit(
+                    "Env(source=source, cache_dir=cache_dir).load(spec)",
+                    "shutil.rmtree(cache_dir, ignore_errors=True)",
+                    globals=namespace,
+                    number=1,
+                ),
+                "warm cache": timeit.timeit(
+                    "Env(source=source, cache_dir=cache_dir).load(spec)",
+                    globals=namespace,
+                    number=number,
+                ),
+            }
+            shutil.rmtree(cache_dir)
+            results["cold cache"] *= number
+            for label, total in results.items():
+                print(
+                    f"{workload:<5} {len(spec):>4} vars  {label:<11}"
+                    f" {total / number * 1e3:8.3f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Measure `Env(cast_cache=True)` when many `Env` instances read the same
+raw values.
+
+Run with `python benchmarks/bench_cast_cache.py`.
+"""
+
+import timeit
+
+from typenv import Env
+
+
+def main() -> None:
+    source = {
+        "SHARDS": ",".join(str(i) for i in range(1_000)),
+        "PRICE": "12.50",
+        "HOSTS": ",".join(f"host-{i}" for i in range(100)),
+    }
+    number = 2_000
+    for cast_cache in (False, True):
+        envs = [Env(source=source, cast_cache=cast_cache) for _ in range(10)]
+        namespace = {"envs": envs}
+        results = {
+            "array": timeit.timeit(
+                "for env in envs: env.array('SHARDS')", globals=namespace, number=number
+            ),
+            "decimal": timeit.timeit(
+                "for env in envs: env.decimal('PRICE')", globals=namespace, number=number
+            ),
+            "list": timeit.timeit(
+                "for env in envs: env.list('HOSTS')", globals=namespace, number=number
+            ),
+        }
+        for label, total in results.items():
+            per_read = total / number / len(envs)
+            print(f"cast_cache={cast_cache!s:<5}  {label:<7} {per_read * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
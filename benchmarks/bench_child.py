@@ -0,0 +1,85 @@
+"""Compare `Env.child` against one new `Env` per tenant.
+
+Both read 50 shared variables once per `Env` tree and 3 variables per
+tenant. Run with `python benchmarks/bench_child.py`.
+"""
+
+from collections.abc import Callable
+import timeit
+import tracemalloc
+
+from typenv import Env
+
+GLOBALS = 50
+TENANTS = 10_000
+
+
+def _source() -> dict[str, str]:
+    source = {f"GLOBAL_{i}": str(i) for i in range(GLOBALS)}
+    for tenant in range(TENANTS):
+        source[f"T{tenant}_DB_URL"] = f"postgres://db/{tenant}"
+        source[f"T{tenant}_POOL_SIZE"] = "10"
+        source[f"T{tenant}_DEBUG"] = "false"
+    return source
+
+
+def _read_globals(env: Env) -> None:
+    for i in range(GLOBALS):
+        env.int(f"GLOBAL_{i}")
+
+
+def _read_tenant(env: Env) -> None:
+    env.str("DB_URL")
+    env.int("POOL_SIZE")
+    env.bool("DEBUG")
+
+
+def _new_envs(source: dict[str, str]) -> list[Env]:
+    envs = []
+    for tenant in range(TENANTS):
+        env = Env(source=source)
+        _read_globals(env)
+        with env.prefixed(f"T{tenant}_"):
+            _read_tenant(env)
+        envs.append(env)
+    return envs
+
+
+def _children(source: dict[str, str]) -> list[Env]:
+    parent = Env(source=source)
+    _read_globals(parent)
+    envs = []
+    for tenant in range(TENANTS):
+        env = parent.child(f"T{tenant}_")
+        _read_tenant(env)
+        envs.append(env)
+    return envs
+
+
+def _memory(func: Callable[[], object]) -> int:
+    """Return memory retained by the result of `func`."""
+    tracemalloc.start()
+    result = func()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    source = _source()
+    cases = {
+        "Env per tenant": lambda: _new_envs(source),
+        "Env.child": lambda: _children(source),
+    }
+    for label, func in cases.items():
+        total = min(timeit.repeat(func, number=1, repeat=3))
+        retained = _memory(func)
+        print(
+            f"{TENANTS} tenants  {label:<15} {total / TENANTS * 1e6:8.2f} us/tenant"
+            f"  retained {retained / TENANTS:8.0f} B/tenant"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare declarative constraints against equivalent lambda validators,
+read one at a time and loaded with a compiled schema.
+
+Run with `python benchmarks/bench_constraints.py`.
+"""
+
+import re
+import timeit
+
+from typenv import Env, Length, Match, NonEmpty, OneOf, Range, Var
+
+LEVELS = ("debug", "info", "warning", "error")
+NAME_PATTERN = r"[a-z][a-z0-9-]*"
+
+
+def _lambda_validators() -> dict[str, list]:
+    return {
+        "int": [lambda v: v >= 1, lambda v: v <= 65535],
+        "level": [lambda v: len(v) > 0, lambda v: v in LEVELS],
+        "name": [lambda v: re.fullmatch(NAME_PATTERN, v), lambda v: len(v) <= 63],
+    }
+
+
+def _constraints() -> dict[str, list]:
+    return {
+        "int": [Range(min=1), Range(max=65535)],
+        "level": [NonEmpty(), OneOf(*LEVELS)],
+        "name": [Match(NAME_PATTERN), Length(max=63)],
+    }
+
+
+def _spec(count: int, validators: dict[str, list]) -> tuple[dict[str, str], dict[str, Var]]:
+    source = {}
+    spec = {}
+    for i in range(count):
+        source[f"PORT_{i}"] = str(8000 + i)
+        source[f"LEVEL_{i}"] = LEVELS[i % len(LEVELS)]
+        source[f"NAME_{i}"] = f"service-{i}"
+        spec[f"PORT_{i}"] = Var("int", validate=validators["int"])
+        spec[f"LEVEL_{i}"] = Var("str", validate=validators["level"])
+        spec[f"NAME_{i}"] = Var("str", validate=validators["name"])
+    return source, spec
+
+
+def _read(env: Env, spec: dict[str, Var]) -> None:
+    for name, var in spec.items():
+        getattr(env, var.type)(name, validate=var.validate)
+
+
+def main() -> None:
+    count = 100
+    number = 100
+    for label, validators in (("lambdas", _lambda_validators()), ("constraints", _constraints())):
+        source, spec = _spec(count, validators)
+        env = Env(source=source)
+        schema = env.compile(spec)
+        results = {
+            "typecast methods": min(
+                timeit.repeat(lambda: _read(env, spec), number=number, repeat=5)  # noqa: B023
+            ),
+            "load": min(
+                timeit.repeat(lambda: env.load(schema), number=number, repeat=5)  # noqa: B023
+            ),
+        }
+        for method, total in results.items():
+            per_var = total / number / len(spec)
+            print(f"{len(spec)} vars  {label:<12} {method:<17} {per_var * 1e9:8.0f} ns/var")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare .env parsing throughput of typenv and python-dotenv.
+
+Run with `python benchmarks/bench_dotenv.py`. Requires python-dotenv.
+"""
+
+import os
+import tempfile
+import timeit
+
+import dotenv
+
+from typenv import _dotenv
+
+
+def _generate(path: str, lines: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            if i % 10 == 0:
+                f.write(f"# Section {i}\n")
+            elif i % 10 == 1:
+                f.write(f"export SECRET_{i}='{'x' * 64}'\n")
+            elif i % 10 == 2:
+                f.write(f'MULTILINE_{i}="line 1\\nline 2"\n')
+            else:
+                f.write(f"VAR_{i}=value_{i} # comment\n")
+
+
+def _typenv_values(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return _dotenv.resolve(_dotenv.parse(f), os.environ, override=False)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for lines in (1_000, 5_000, 20_000):
+            path = os.path.join(tmp_dir, f"{lines}.env")
+            _generate(path, lines)
+            assert _typenv_values(path) == dotenv.dotenv_values(path)
+            number = max(1, 100_000 // lines)
+            for label, func in (
+                ("typenv", _typenv_values),
+                ("python-dotenv", dotenv.dotenv_values),
+            ):
+                total = timeit.timeit(lambda: func(path), number=number)  # noqa: B023
+                per_sec = lines * number / total
+                print(f"{lines:>6} lines  {label:<14} {per_sec:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
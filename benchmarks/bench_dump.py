@@ -0,0 +1,44 @@
+"""Compare `Env.dump` against `Env.parsed_view`, and measure
+`Env.get_example` on an `Env` with many parsed values.
+
+Run with `python benchmarks/bench_dump.py`.
+"""
+
+import timeit
+
+from typenv import Env
+
+
+def _legacy_get_example(env: Env) -> str:
+    """The `get_example` of typenv 0.2.0, for comparison."""
+    env_example = ""
+    for k, v in sorted(env.dump().items()):
+        value_example = v.type
+        if v.optional:
+            value_example = f"Optional[{value_example}]"
+        env_example += f"{k}={value_example}\n"
+    return env_example
+
+
+def main() -> None:
+    for count in (100, 5_000):
+        env = Env(source={f"VAR_{i}": str(i) for i in range(count)})
+        # Read in unsorted order
+        for i in reversed(range(count)):
+            env.int(f"VAR_{i}")
+        number = max(1, 200_000 // count)
+        namespace = {**globals(), "env": env}
+        results = {
+            "dump": timeit.timeit("env.dump()", globals=namespace, number=number),
+            "parsed_view": timeit.timeit("env.parsed_view()", globals=namespace, number=number),
+            "get_example (0.2.0)": timeit.timeit(
+                "_legacy_get_example(env)", globals=namespace, number=number
+            ),
+            "get_example": timeit.timeit("env.get_example()", globals=namespace, number=number),
+        }
+        for label, total in results.items():
+            print(f"{count:>5} vars  {label:<19} {total / number * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
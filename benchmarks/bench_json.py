@@ -0,0 +1,50 @@
+"""Measure `Env.json` with different JSON decoders and payload sizes.
+
+Run with `python benchmarks/bench_json.py`. orjson and ujson are
+measured if installed.
+"""
+
+import importlib
+import json
+import timeit
+
+from typenv import Env
+
+
+def _routing_table(routes: int) -> str:
+    return json.dumps(
+        {
+            f"/api/v1/resource_{i}": {"upstream": f"service-{i % 50}", "weight": i % 7}
+            for i in range(routes)
+        }
+    )
+
+
+def main() -> None:
+    decoders = {"json": json.loads}
+    for module_name in ("orjson", "ujson"):
+        try:
+            decoders[module_name] = importlib.import_module(module_name).loads
+        except ImportError:
+            pass
+
+    for routes in (10, 1_000, 50_000):
+        payload = _routing_table(routes)
+        number = max(1, 1_000_000 // len(payload))
+
+        stdlib_env = Env(source={"ROUTES": payload}, json_loads=json.loads)
+        results = {
+            # typenv 0.2.0 re-serialized every parsed value
+            "json (0.2.0)": timeit.timeit(
+                lambda: json.dumps(stdlib_env.json("ROUTES")), number=number  # noqa: B023
+            )
+        }
+        for label, loads in decoders.items():
+            env = Env(source={"ROUTES": payload}, json_loads=loads)
+            results[label] = timeit.timeit(lambda: env.json("ROUTES"), number=number)  # noqa: B023
+        for label, total in results.items():
+            print(f"{len(payload) / 1024:>8.1f} KiB  {label:<13} {total / number * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
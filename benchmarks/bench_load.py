@@ -0,0 +1,52 @@
+"""Compare `Env.load` against one typecast method call per variable.
+
+Also measures loading from a snapshot of the environment instead of
+`os.environ`.
+
+Run with `python benchmarks/bench_load.py`.
+"""
+
+import os
+import timeit
+
+from typenv import Env, Var
+
+
+def _populate(count: int) -> list[str]:
+    names = [f"TYPENV_BENCH_{i}" for i in range(count)]
+    for i, name in enumerate(names):
+        os.environ[name] = str(i)
+    return names
+
+
+def _per_call(env: Env, names: list[str]) -> None:
+    for name in names:
+        env.int(name, validate=lambda v: v >= 0)
+
+
+def main() -> None:
+    for count in (10, 100, 1000):
+        names = _populate(count)
+        env = Env()
+        spec = {name: Var("int", validate=lambda v: v >= 0) for name in names}
+        schema = env.compile(spec)
+        snapshot_env = Env(source=Env.snapshot())
+        number = max(1, 10_000 // count)
+        results = {
+            "per call": timeit.timeit(
+                "_per_call(env, names)", globals={**globals(), **locals()}, number=number
+            ),
+            "load": timeit.timeit("env.load(spec)", globals=locals(), number=number),
+            "load (compiled)": timeit.timeit("env.load(schema)", globals=locals(), number=number),
+            "load (snapshot)": timeit.timeit(
+                "snapshot_env.load(schema)", globals=locals(), number=number
+            ),
+        }
+        for label, total in results.items():
+            print(f"{count:>5} vars  {label:<16} {total / number * 1e6:10.1f} us")
+        for name in names:
+            del os.environ[name]
+
+
+if __name__ == "__main__":
+    main()
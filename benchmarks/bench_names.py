@@ -0,0 +1,37 @@
+"""Measure per-read overhead of name resolution and validation.
+
+Run with `python benchmarks/bench_names.py`.
+"""
+
+import os
+import timeit
+
+from typenv import Env
+
+CASES = [
+    ([], "tenant_acme_feature_flag"),
+    (["TENANT_"], "acme_feature_flag"),
+    (["TENANT_", "ACME_", "FEATURE_"], "flag"),
+]
+
+
+def main() -> None:
+    os.environ["TENANT_ACME_FEATURE_FLAG"] = "true"
+    env = Env(upper=True)
+    number = 200_000
+    for prefix, name in CASES:
+        env.prefix = prefix
+        namespace = {"env": env, "name": name}
+        results = {
+            "_preprocess_name": timeit.timeit(
+                "env._preprocess_name(name)", globals=namespace, number=number
+            ),
+            "env.bool": timeit.timeit("env.bool(name)", globals=namespace, number=number),
+        }
+        for label, total in results.items():
+            print(f"prefix depth {len(prefix)}  {label:<17} {total / number * 1e9:8.0f} ns")
+    env.prefix = []
+
+
+if __name__ == "__main__":
+    main()
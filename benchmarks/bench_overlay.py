@@ -0,0 +1,51 @@
+"""Compare setting variables for a test with `monkeypatch.setenv` against
+`Env.overlay`, which backs the `env_overlay` fixture.
+
+Each iteration sets the variables, reads them, and undoes the change, as
+a test with a fixture would.
+
+Run with `python benchmarks/bench_overlay.py`.
+"""
+
+import timeit
+
+import pytest
+
+from typenv import Env
+
+
+def _monkeypatch(env: Env, values: dict[str, str]) -> None:
+    monkeypatch = pytest.MonkeyPatch()
+    for key, value in values.items():
+        monkeypatch.setenv(key, value)
+    for key in values:
+        env.str(key)
+    monkeypatch.undo()
+
+
+def _overlay(env: Env, values: dict[str, str]) -> None:
+    with Env.overlay(values):
+        for key in values:
+            env.str(key)
+
+
+def main() -> None:
+    env = Env()
+    for count in (1, 10, 50):
+        values = {f"TYPENV_BENCH_{i}": str(i) for i in range(count)}
+        number = 20_000 // count
+        namespace = {**globals(), "env": env, "values": values}
+        results = {
+            "monkeypatch.setenv": timeit.timeit(
+                "_monkeypatch(env, values)", globals=namespace, number=number
+            ),
+            "Env.overlay": timeit.timeit(
+                "_overlay(env, values)", globals=namespace, number=number
+            ),
+        }
+        for label, total in results.items():
+            print(f"{count:>3} vars  {label:<19} {total / number * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare reading `<name>_FILE` secrets one by one, with `Env.load`, and
+with `Env.aload`, which reads them concurrently.
+
+Run with `python benchmarks/bench_secrets.py [DIRECTORY]`. The files are
+created in DIRECTORY, which defaults to a temporary directory. Point it
+to a network or container volume mount to measure a slow file system.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from typenv import Env, Var
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    directory = tempfile.mkdtemp(dir=sys.argv[1] if len(sys.argv) > 1 else None)
+    try:
+        for count in (1, 10, 50, 200):
+            source = {}
+            for i in range(count):
+                path = os.path.join(directory, f"secret_{i}")
+                with open(path, "w") as f:
+                    f.write(os.urandom(32).hex() + "\n")
+                source[f"SECRET_{i}_FILE"] = path
+            env = Env(source=source)
+            names = [f"SECRET_{i}" for i in range(count)]
+            schema = env.compile({name: Var("str", from_file=True) for name in names})
+            namespace = {"env": env, "names": names, "schema": schema, "loop": loop}
+            number = max(1, 2_000 // count)
+            results = {
+                "one by one": timeit.timeit(
+                    "for name in names: env.str(name, from_file=True)",
+                    globals=namespace,
+                    number=number,
+                ),
+                "load": timeit.timeit("env.load(schema)", globals=namespace, number=number),
+                "aload": timeit.timeit(
+                    "loop.run_until_complete(env.aload(schema))", globals=namespace, number=number
+                ),
+            }
+            for label, total in results.items():
+                print(f"{count:>4} files  {label:<11} {total / number * 1e3:8.3f} ms")
+    finally:
+        shutil.rmtree(directory)
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure `Env.load` with cheap, CPU bound and I/O bound validators,
+with and without memoization and concurrent validation.
+
+The I/O bound validator sleeps to stand in for e.g. a DNS lookup.
+
+Run with `python benchmarks/bench_validators.py`.
+"""
+
+import ipaddress
+import os
+import time
+import timeit
+
+from typenv import Env, Var
+
+
+def _is_cidr_list(networks: list) -> bool:
+    return all(ipaddress.ip_network(network) for network in networks)
+
+
+def _resolves(host: str) -> bool:
+    time.sleep(0.001)
+    return True
+
+
+def _spec(count: int) -> tuple[dict[str, str], dict[str, Var]]:
+    source = {}
+    spec = {}
+    for i in range(count):
+        source[f"PORT_{i}"] = str(8000 + i)
+        source[f"DIR_{i}"] = os.getcwd()
+        source[f"NETWORKS_{i}"] = ",".join(f"10.{i % 256}.{j}.0/24" for j in range(50))
+        source[f"HOST_{i}"] = f"service-{i}.internal"
+        spec[f"PORT_{i}"] = Var("int", validate=lambda v: 0 < v < 65536)
+        spec[f"DIR_{i}"] = Var("str", validate=os.path.isdir)
+        spec[f"NETWORKS_{i}"] = Var("list", validate=_is_cidr_list)
+        spec[f"HOST_{i}"] = Var("str", validate=_resolves)
+    return source, spec
+
+
+def main() -> None:
+    for count in (5, 50):
+        source, spec = _spec(count)
+        envs = {
+            "serial": (Env(source=source), False),
+            "memoized": (Env(source=source, memoize_validators=True), False),
+            "concurrent": (Env(source=source), True),
+            "memoized, concurrent": (Env(source=source, memoize_validators=True), True),
+        }
+        number = max(1, 100 // count)
+        for label, (env, concurrent) in envs.items():
+            schema = env.compile(spec)
+            total = timeit.timeit(
+                lambda: env.load(schema, concurrent_validation=concurrent),  # noqa: B023
+                number=number,
+            )
+            print(f"{len(spec):>4} vars  {label:<21} {total / number * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
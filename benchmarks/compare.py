@@ -0,0 +1,63 @@
+"""Compare results of `benchmarks/suite.py` against a baseline.
+
+Run with `python benchmarks/compare.py BASELINE.json RESULTS.json`.
+Exits with status 1 if the median time of a benchmark is slower than in
+the baseline by more than `--threshold` percent (by default 10).
+Requires pyperf.
+"""
+
+import argparse
+import sys
+
+import pyperf
+
+
+def compare(
+    baseline: pyperf.BenchmarkSuite, results: pyperf.BenchmarkSuite, threshold: float
+) -> list[str]:
+    """Print a comparison table and return names of benchmarks that
+    slowed down by more than `threshold` percent."""
+    slower = []
+    baseline_names = set(baseline.get_benchmark_names())
+    for bench in results.get_benchmarks():
+        name = bench.get_name()
+        if name not in baseline_names:
+            print(f"{name:<32} {'':>12} {bench.format_value(bench.median()):>12}  (new)")
+            continue
+        old = baseline.get_benchmark(name)
+        change = (bench.median() / old.median() - 1) * 100
+        flag = ""
+        if change > threshold:
+            flag = "  SLOWER"
+            slower.append(name)
+        print(
+            f"{name:<32} {old.format_value(old.median()):>12}"
+            f" {bench.format_value(bench.median()):>12}  {change:+6.1f}%{flag}"
+        )
+    for name in sorted(baseline_names - set(results.get_benchmark_names())):
+        print(f"{name:<32} (missing from results)")
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="baseline JSON file")
+    parser.add_argument("results", help="results JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed slowdown in percent"
+    )
+    args = parser.parse_args()
+    slower = compare(
+        pyperf.BenchmarkSuite.load(args.baseline),
+        pyperf.BenchmarkSuite.load(args.results),
+        args.threshold,
+    )
+    if slower:
+        print(
+            f"\n{len(slower)} benchmark(s) slower than the baseline by more than {args.threshold}%"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
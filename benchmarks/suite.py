@@ -0,0 +1,119 @@
+"""Benchmark suite for tracking performance regressions.
+
+Requires pyperf. Run with
+
+    python benchmarks/suite.py -o baseline.json
+
+to store the results as a JSON baseline. After a change, store new
+results the same way and compare them to the baseline with
+`benchmarks/compare.py`. Options of `pyperf`, e.g. `--fast` and
+`--rigorous`, are supported. Results are only comparable between runs
+on the same machine.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import tempfile
+
+import pyperf
+
+import typenv
+from typenv import Env
+
+# Input values of each typecast method by size. `bool` values are fixed
+# size. Every type in `typenv._typecast_map` must have an entry.
+INPUTS: dict[str, dict[str, str]] = {
+    "str": {"small": "x" * 16, "large": "x" * 64 * 1024},
+    "int": {"small": "12345", "large": "9" * 4000},
+    "bool": {"small": "true"},
+    "float": {"small": "1.5", "large": "1." + "5" * 1000},
+    "decimal": {"small": "12.50", "large": "1." + "5" * 10_000},
+    "list": {"small": "a,b,c", "large": ",".join(f"item{i}" for i in range(10_000))},
+    "json": {
+        "small": '{"a": 1}',
+        "large": json.dumps({f"/api/{i}": {"upstream": f"svc-{i}"} for i in range(2_000)}),
+    },
+    "array": {"small": "1,2,3", "large": ",".join(str(i) for i in range(10_000))},
+    "bytes": {"small": "ab" * 16, "large": "ab" * 64 * 1024},
+}
+# Required keyword arguments of typecast methods
+KWDS: dict[str, dict[str, str]] = {"bytes": {"encoding": "hex"}}
+PREFIX_DEPTHS = (0, 3, 10)
+DOTENV_LINES = (1_000, 20_000)
+DUMP_ENTRIES = 5_000
+
+
+def _bench_casts(runner: pyperf.Runner) -> None:
+    for cast_type in typenv._typecast_map:
+        for size, value in INPUTS[cast_type].items():
+            method = getattr(Env(source={"VALUE": value}), cast_type)
+            func = functools.partial(method, "VALUE", **KWDS.get(cast_type, {}))
+            runner.bench_func(f"cast_{cast_type}_{size}", func)
+
+
+def _bench_names(runner: pyperf.Runner) -> None:
+    env = Env(upper=True)
+    for depth in PREFIX_DEPTHS:
+        with contextlib.ExitStack() as stack:
+            for i in range(depth):
+                stack.enter_context(env.prefixed(f"level{i}_"))
+            runner.bench_func(f"preprocess_name_depth_{depth}", env._preprocess_name, "name")
+            name = env._preprocess_name("name")
+            runner.bench_func(f"validate_name_depth_{depth}", env._validate_name, name)
+
+
+def _generate_dotenv(path: str, lines: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            if i % 10 == 0:
+                f.write(f"# Section {i}\n")
+            elif i % 10 == 1:
+                f.write(f"export SECRET_{i}='{'x' * 64}'\n")
+            elif i % 10 == 2:
+                f.write(f'MULTILINE_{i}="line 1\\nline 2"\n')
+            else:
+                f.write(f"VAR_{i}=value_{i} # comment\n")
+
+
+def _read_env(path: str) -> None:
+    Env.read_env(path, target={})
+
+
+def _bench_read_env(runner: pyperf.Runner, tmp_dir: str) -> None:
+    for lines in DOTENV_LINES:
+        path = os.path.join(tmp_dir, f"{lines}.env")
+        _generate_dotenv(path, lines)
+        runner.bench_func(f"read_env_{lines}_lines", _read_env, path)
+
+
+def _bench_dump(runner: pyperf.Runner) -> None:
+    env = Env(source={f"VAR_{i}": str(i) for i in range(DUMP_ENTRIES)})
+    for i in range(DUMP_ENTRIES):
+        env.int(f"VAR_{i}")
+    runner.bench_func(f"dump_{DUMP_ENTRIES}_entries", env.dump)
+    runner.bench_func(f"get_example_{DUMP_ENTRIES}_entries", env.get_example)
+
+
+def _bench_import(runner: pyperf.Runner) -> None:
+    # Both include interpreter startup, which `python_startup` measures
+    # alone for reference
+    runner.bench_command("python_startup", [sys.executable, "-c", "pass"])
+    runner.bench_command("import_typenv", [sys.executable, "-c", "import typenv"])
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    runner.metadata["typenv_version"] = typenv.__version__
+    _bench_casts(runner)
+    _bench_names(runner)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _bench_read_env(runner, tmp_dir)
+    _bench_dump(runner)
+    _bench_import(runner)
+
+
+if __name__ == "__main__":
+    main()
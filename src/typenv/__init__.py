@@ -2,17 +2,29 @@ from __future__ import annotations
 
 __version__ = "0.2.0"  # DO NOT EDIT THIS LINE MANUALLY. LET bump2version UTILITY DO IT
 
-from collections.abc import Callable, Generator, Iterable, Mapping
+import bisect
+import collections
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, MutableMapping
 import contextlib
-from decimal import Decimal as D
-import json
+import contextvars
+import functools
+import importlib
+import itertools
 import os
-import string
-from types import MappingProxyType
+import time
+from types import CodeType, MappingProxyType, MethodType
 import typing
-from typing import Any, Literal, NamedTuple, TypeVar, Union
+from typing import Any, Generic, Literal, NamedTuple, TypeVar, Union
+import weakref
 
-import dotenv
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from array import array as _Array
+    from decimal import Decimal as D
+    import threading
+
+# Modules that are not needed by the most common typecasts, e.g. `json`
+# and `decimal`, are imported where they are used to keep `import typenv`
+# fast.
 
 _EMPTY_MAP: MappingProxyType = MappingProxyType({})
 
@@ -29,6 +41,14 @@ _List = list
 _T = TypeVar("_T")
 # TODO: Use the "|" operator when minimum Python version is 3.10
 _JSONType = Union[None, bool, int, float, str, list, dict]
+_BytesEncoding = Literal["hex", "base64", "base64url", "base85"]
+# Arguments of `Env._resolve` after `cast_type`: caster, default,
+# validators, typecast keyword arguments and whether the value is read from
+# the file named by `<name>_FILE`
+_ReadSpec = tuple[Callable, Any, Iterable[Callable], Mapping[str, Any], bool]
+# Name, value, validators and parsed value of a variable read by `Env.load`
+# with concurrent validation
+_PendingValidation = tuple[str, Any, Iterable[Callable], "ParsedValue"]
 
 
 class _Missing:
@@ -38,7 +58,13 @@ class _Missing:
     """
 
 
-_DEFAULT_NAME_CHARS = string.ascii_uppercase + string.digits + "_"
+_DEFAULT_NAME_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+# Max number of validated names cached per `Env`
+_NAME_CACHE_SIZE = 4096
+# Max number of results cached per type with `Env(cast_cache=True)`
+_CAST_CACHE_SIZE = 1024
+# Max number of passed validations memoized per `Env`
+_VALIDATION_CACHE_SIZE = 4096
 
 
 class ParsedValue(NamedTuple):
@@ -47,6 +73,43 @@ class ParsedValue(NamedTuple):
     optional: bool
 
 
+class ReadEvent(NamedTuple):
+    """A variable read, passed to hooks added with `Env.add_hook`.
+
+    `outcome` is "value" if the value was cast from the source,
+    "default" if the default was used, "cached" if the value came from
+    `Env.from_frozen` or the `Env.load` cache, and "error" if the read
+    failed. Durations are in nanoseconds.
+    """
+
+    name: str
+    type: str
+    outcome: str
+    name_ns: int
+    lookup_ns: int
+    cast_ns: int
+    validate_ns: int
+
+
+class VarStats(NamedTuple):
+    """Read counters of a variable, returned by `Env.stats`."""
+
+    reads: int
+    cache_hits: int
+    defaults: int
+    errors: int
+    total_ns: int
+
+
+class FrozenEnv(NamedTuple):
+    """Parsed values of an `Env`, created by `Env.freeze`.
+
+    Use `Env.from_frozen` to restore.
+    """
+
+    parsed: tuple[tuple[str, ParsedValue], ...]
+
+
 def _cast_bool(value: str) -> bool:
     if value.lower() == "true":
         return True
@@ -61,38 +124,692 @@ def _cast_list(value: str, subcast: Callable = str) -> list:
     return [subcast(item) for item in value.split(",")]
 
 
-def _cast_bytes(value: str) -> bytes:
-    """Cast a string to bytes.
+def _cast_decimal(value: str) -> D:
+    from decimal import Decimal
+
+    return Decimal(value)
 
-    For now this only deals with hex encoded strings.
+
+def _cast_json(value: str, loads: Callable[[str], Any]) -> Any:
+    return loads(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_json_loads() -> Callable[[str], Any]:
+    """Return the fastest available JSON decoder."""
+    for module_name in ("orjson", "ujson"):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        loads: Callable[[str], Any] = module.loads
+        return loads
+    import json
+
+    return json.loads
+
+
+def _check_json_serializable(value: Any) -> None:
+    import json
+
+    json.dumps(value)
+
+
+def _cast_bytes(value: str, encoding: str = "hex", mutable: bool = False) -> bytes | bytearray:
+    """Cast an encoded string to bytes, or to a bytearray if `mutable`."""
+    if encoding == "hex":
+        if value.startswith(("0x", "0X")):
+            value = value[2:]
+        if len(value) % 2:
+            value = "0" + value
+        # Decode straight into the result type to not leave an extra copy
+        # of the bytes behind
+        return bytearray.fromhex(value) if mutable else bytes.fromhex(value)
+
+    import base64
+
+    if encoding == "base64":
+        result = base64.b64decode(value, validate=True)
+    elif encoding == "base64url":
+        # Padding is often left out in URL safe base64
+        value += "=" * (-len(value) % 4)
+        result = base64.b64decode(value, altchars=b"-_", validate=True)
+    elif encoding == "base85":
+        result = base64.b85decode(value)
+    else:
+        raise ValueError(f'Unknown encoding "{encoding}"')
+    return bytearray(result) if mutable else result
+
+
+def _cast_array(value: str, typecode: str = "q", sep: str = ",") -> _Array:
+    """Cast a string of numbers to an `array.array`.
+
+    Integer arrays also accept inclusive ranges such as `1-1000`.
     """
-    value = value.lower().removeprefix("0x")
-    if len(value) % 2:
-        value = "0" + value
-    return bytes.fromhex(value)
+    from array import array
+
+    if value == "":
+        return array(typecode)
+    items = value.split(sep)
+    if typecode in ("f", "d"):
+        return array(typecode, map(float, items))
+    if "-" not in value:
+        return array(typecode, map(int, items))
+    result = array(typecode)
+    for item in items:
+        # Start searching from the second char so that a minus sign is
+        # not mistaken for a range
+        range_sep = item.find("-", 1)
+        if range_sep == -1:
+            result.append(int(item))
+            continue
+        start, end = int(item[:range_sep]), int(item[range_sep + 1 :])
+        if start > end:
+            raise ValueError(f'Invalid range "{item}"')
+        result.extend(range(start, end + 1))
+    return result
 
 
-# Functions that cast a string to a type
-_typecast_map: Mapping[str, Callable] = {
+# Functions that cast a string to a type. `Env.register_type` adds to this.
+_typecast_map: dict[str, Callable] = {
     "bool": _cast_bool,
-    "decimal": D,
+    "decimal": _cast_decimal,
     "float": float,
     "int": int,
-    "json": json.loads,
+    "json": _cast_json,
     "list": _cast_list,
     "str": str,
     "bytes": _cast_bytes,
+    "array": _cast_array,
+}
+
+
+# Functions that cast a string to a `list` subcast type. `Decimal` is
+# handled separately so that `decimal` is not imported unless needed.
+_subcast_map: dict[Any, Callable] = {str: str, int: int, bool: _cast_bool, float: float}
+
+
+def _subcast_func(subcast: Callable) -> Callable:
+    try:
+        return _subcast_map[subcast]
+    except KeyError:
+        pass
+    # The caller has imported `decimal` already if `subcast` is `Decimal`
+    from decimal import Decimal
+
+    if subcast is not Decimal:
+        raise ValueError(f"Unsupported subcast {subcast!r}")
+    return _cast_decimal
+
+
+# Typecasts whose results are immutable, so that `Env(cast_cache=True)`
+# can share them between reads
+_IMMUTABLE_CASTS = {"str", "int", "bool", "float", "decimal"}
+# `list` subcast functions whose results are immutable
+_IMMUTABLE_SUBCASTS: set[Callable] = {str, int, _cast_bool, float, _cast_decimal}
+
+
+def _cached_caster(cast_type: str) -> Callable:
+    """Return the typecast function of `cast_type` wrapped in an LRU
+    cache of results.
+
+    Results that a caller could modify are copied on every read, or not
+    cached, so that modifying one does not affect other reads.
+    """
+    caster = _typecast_map[cast_type]
+    if cast_type in _IMMUTABLE_CASTS:
+        return functools.lru_cache(maxsize=_CAST_CACHE_SIZE)(caster)
+    if cast_type not in {"bytes", "list", "array"}:
+        # E.g. `json`, whose results would need a deep copy
+        return caster
+    cached = functools.lru_cache(maxsize=_CAST_CACHE_SIZE)(caster)
+
+    def cast(value: str, **kwds: Any) -> Any:
+        if cast_type == "bytes":
+            # A `bytearray` is returned so that the caller can wipe it
+            return caster(value, **kwds) if kwds.get("mutable") else cached(value, **kwds)
+        if kwds.get("subcast", str) not in _IMMUTABLE_SUBCASTS:
+            return caster(value, **kwds)
+        # A list or an array of immutable items
+        return cached(value, **kwds)[:]
+
+    return cast
+
+
+class _CachedCasters(dict):
+    """Typecast functions wrapped by `_cached_caster`, created on first
+    use and shared by all `Env` instances."""
+
+    def __missing__(self, cast_type: str) -> Callable:
+        caster = self[cast_type] = _cached_caster(cast_type)
+        return caster
+
+
+_cached_casters = _CachedCasters()
+
+
+class Var:
+    """Declaration of an environment variable for `Env.load`.
+
+    Keyword arguments other than `default`, `validate` and `from_file`
+    are the typecast specific keyword arguments of the corresponding
+    `Env` method, e.g. `Var("list", subcast=int)`.
+    """
+
+    __slots__ = ("type", "default", "validate", "from_file", "kwds")
+
+    def __init__(
+        self,
+        type: str,  # noqa: A002
+        *,
+        default: Any = _Missing,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: bool = False,
+        **kwds: Any,
+    ):
+        if type not in _typecast_map:
+            raise ValueError(f'Unknown type "{type}"')
+        self.type = type
+        self.default = default
+        self.validate = validate
+        self.from_file = from_file
+        self.kwds = kwds
+
+
+class _Constraint:
+    """Base class of declarative validators.
+
+    A constraint is a validator that raises `ValueError` if a value does
+    not satisfy it. Its repr is shown in `Env.get_example`, and
+    `Env.compile` compiles consecutive constraints of a variable into one
+    generated function.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, value: Any) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+    def _condition(self, ref: str, namespace: dict[str, Any]) -> str:
+        """Return a Python expression that is true if `value`
+        satisfies the constraint.
+
+        Add objects that the expression needs to `namespace`, with
+        names starting with `ref`.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def _parts(self) -> tuple[_Constraint, ...]:
+        """Return the constraints to show in `Env.get_example`."""
+        return (self,)
+
+    def _fail(self, value: Any) -> typing.NoReturn:
+        raise ValueError(f"{value!r} does not satisfy {self!r}")
+
+
+class _Bounds(_Constraint):
+    __slots__ = ("min", "max")
+
+    # Expression of `value` that is compared to the bounds
+    _subject = "value"
+
+    def __init__(self, min: Any = None, max: Any = None):  # noqa: A002
+        if min is None and max is None:
+            raise ValueError(f"{type(self).__name__} needs min or max")
+        if min is not None and max is not None and min > max:
+            raise ValueError(f"{type(self).__name__} min is greater than max")
+        self.min = min
+        self.max = max
+
+    def __repr__(self) -> str:
+        name = type(self).__name__
+        if self.min is None:
+            return f"{name}(max={self.max!r})"
+        if self.max is None:
+            return f"{name}(min={self.min!r})"
+        return f"{name}({self.min!r}, {self.max!r})"
+
+    def _condition(self, ref: str, namespace: dict[str, Any]) -> str:
+        expression = self._subject
+        if self.min is not None:
+            namespace[f"{ref}_min"] = self.min
+            expression = f"{ref}_min <= {expression}"
+        if self.max is not None:
+            namespace[f"{ref}_max"] = self.max
+            expression = f"{expression} <= {ref}_max"
+        return expression
+
+
+class Range(_Bounds):
+    """Validate that a number is within inclusive bounds, e.g.
+    `Range(1, 65535)` or `Range(min=0)`."""
+
+    __slots__ = ()
+
+    def __call__(self, value: Any) -> bool:
+        # Compare as in `_condition`, so that e.g. NaN fails both
+        if not (
+            (self.min is None or self.min <= value) and (self.max is None or value <= self.max)
+        ):
+            self._fail(value)
+        return True
+
+
+class Length(_Bounds):
+    """Validate that the length of a value is within inclusive bounds,
+    e.g. `Length(max=255)`."""
+
+    __slots__ = ()
+
+    _subject = "len(value)"
+
+    def __call__(self, value: Any) -> bool:
+        length = len(value)
+        if not (
+            (self.min is None or self.min <= length) and (self.max is None or length <= self.max)
+        ):
+            self._fail(value)
+        return True
+
+
+class NonEmpty(_Constraint):
+    """Validate that a string, list or other collection is not empty."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NonEmpty()"
+
+    def __call__(self, value: Any) -> bool:
+        if not len(value):
+            self._fail(value)
+        return True
+
+    def _condition(self, ref: str, namespace: dict[str, Any]) -> str:
+        return "len(value)"
+
+
+class OneOf(_Constraint):
+    """Validate that a value is one of `choices`, e.g.
+    `OneOf("debug", "info")`."""
+
+    __slots__ = ("choices", "_choice_set")
+
+    def __init__(self, *choices: Any):
+        if not choices:
+            raise ValueError("OneOf needs at least one choice")
+        self.choices = choices
+        self._choice_set = frozenset(choices)
+
+    def __repr__(self) -> str:
+        return f"OneOf({', '.join(map(repr, self.choices))})"
+
+    def __call__(self, value: Any) -> bool:
+        if value not in self._choice_set:
+            self._fail(value)
+        return True
+
+    def _condition(self, ref: str, namespace: dict[str, Any]) -> str:
+        namespace[f"{ref}_choices"] = self._choice_set
+        return f"value in {ref}_choices"
+
+
+class Match(_Constraint):
+    """Validate that a whole string matches a regular expression, e.g.
+    `Match(r"[a-z]+")`.
+
+    The pattern is compiled once.
+    """
+
+    __slots__ = ("pattern", "flags", "_fullmatch")
+
+    def __init__(self, pattern: str, flags: int = 0):
+        import re
+
+        self.pattern = pattern
+        self.flags = flags
+        self._fullmatch = re.compile(pattern, flags).fullmatch
+
+    def __repr__(self) -> str:
+        if self.flags:
+            import re
+
+            return f"Match({self.pattern!r}, flags={re.RegexFlag(self.flags)!r})"
+        return f"Match({self.pattern!r})"
+
+    def __call__(self, value: Any) -> bool:
+        if self._fullmatch(value) is None:
+            self._fail(value)
+        return True
+
+    def _condition(self, ref: str, namespace: dict[str, Any]) -> str:
+        namespace[f"{ref}_fullmatch"] = self._fullmatch
+        return f"{ref}_fullmatch(value) is not None"
+
+
+class _AllOf(_Constraint):
+    """Constraints compiled into one generated function that checks
+    them all.
+
+    `check` is a method of this object, so that the constraints can be
+    found from it, but it is as fast to call as a plain function.
+    """
+
+    __slots__ = ("constraints", "check")
+
+    def __init__(self, constraints: Iterable[_Constraint]):
+        self.constraints = tuple(constraints)
+        namespace: dict[str, Any] = {}
+        lines = ["def check(self, value):"]
+        for i, constraint in enumerate(self.constraints):
+            namespace[f"c{i}"] = constraint
+            condition = constraint._condition(f"c{i}", namespace)
+            lines.append(f"    if not ({condition}):\n        c{i}._fail(value)")
+        lines.append("    return True")
+        exec("\n".join(lines), namespace)
+        self.check: Callable[[Any], bool] = MethodType(namespace["check"], self)
+
+    def __repr__(self) -> str:
+        return f"_AllOf({', '.join(map(repr, self.constraints))})"
+
+    def __call__(self, value: Any) -> bool:
+        return self.check(value)
+
+    def _parts(self) -> tuple[_Constraint, ...]:
+        return self.constraints
+
+
+def _compile_constraints(validators: Iterable[Callable]) -> tuple[Callable, ...]:
+    """Replace each run of consecutive constraints in `validators` with
+    the `check` method of an `_AllOf`, keeping the order of
+    validation."""
+    compiled: list[Callable] = []
+    for is_constraint, group in itertools.groupby(
+        validators, key=lambda validator: isinstance(validator, _Constraint)
+    ):
+        if is_constraint:
+            compiled.append(_AllOf(group).check)  # type: ignore[arg-type]
+        else:
+            compiled.extend(group)
+    return tuple(compiled)
+
+
+def _callable_key(func: Callable) -> str:
+    """Return a string that identifies `func` across processes."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Builtin functions and classes have a stable repr. Other objects
+        # usually include their address, and never match a cache entry
+        # written by another process.
+        return repr((getattr(func, "__module__", None), repr(func)))
+    closure = tuple(cell.cell_contents for cell in func.__closure__ or ())
+    # `__self__` of a bound method
+    bound_to = getattr(func, "__self__", None)
+    return repr(
+        (
+            func.__module__,
+            func.__qualname__,
+            _code_key(code),
+            func.__defaults__,
+            closure,
+            bound_to,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_key(code: CodeType) -> str:
+    # Functions declared in a loop share a code object, so this is
+    # computed once for all of them.
+    import hashlib
+
+    # Nested functions and comprehensions are code objects in
+    # `co_consts`, whose repr includes their address
+    consts = tuple(
+        _code_key(const) if isinstance(const, CodeType) else const for const in code.co_consts
+    )
+    # `co_names` holds the names of called functions and accessed
+    # attributes, which `co_code` only refers to by index
+    return hashlib.sha256(repr((code.co_code, consts, code.co_names)).encode()).hexdigest()
+
+
+class _CompiledVar(NamedTuple):
+    key: str
+    name: str
+    type: str
+    caster: Callable
+    default: Any
+    validators: tuple[Callable, ...]
+    typecast_kwds: Mapping[str, Any]
+    # Name of the variable holding a file path, if read from a file
+    file_name: str | None
+
+
+class Schema:
+    """A set of variable declarations compiled by `Env.compile`.
+
+    Names, typecast functions and validators are resolved once, so
+    loading a schema repeatedly only reads, casts and validates the
+    values.
+    """
+
+    __slots__ = ("_vars", "_file_vars", "_digest")
+
+    def __init__(self, compiled_vars: Iterable[_CompiledVar]):
+        self._vars = tuple(compiled_vars)
+        self._file_vars = tuple(var for var in self._vars if var.file_name is not None)
+        self._digest: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._vars)
+
+    def names(self) -> list[str]:
+        """Return the full environment variable names in the schema."""
+        return [var.name for var in self._vars]
+
+    def _spec_digest(self) -> str:
+        """Return a hex digest of the declarations, including types,
+        defaults and validators."""
+        if self._digest is None:
+            import hashlib
+
+            # Keyed by `id()`, which is stable because `self._vars` holds
+            # the objects. Many declarations share typecast functions.
+            keys: dict[int, str] = {}
+
+            def key(obj: Any) -> str:
+                try:
+                    return keys[id(obj)]
+                except KeyError:
+                    k = keys[id(obj)] = _callable_key(obj) if callable(obj) else repr(obj)
+                    return k
+
+            spec = [
+                (
+                    var.key,
+                    var.name,
+                    var.type,
+                    # Not `var.caster`, which `Env(cast_cache=True)` wraps
+                    key(_typecast_map[var.type]),
+                    key(var.default),
+                    [key(validator) for validator in var.validators],
+                    sorted((k, key(v)) for k, v in var.typecast_kwds.items()),
+                    var.file_name,
+                )
+                for var in self._vars
+            ]
+            self._digest = hashlib.sha256(repr((__version__, spec)).encode()).hexdigest()
+        return self._digest
+
+
+# Typecast method names of type hints supported by `Env.bind`
+_HINT_TYPES = {
+    "builtins.str": "str",
+    "builtins.int": "int",
+    "builtins.bool": "bool",
+    "builtins.float": "float",
+    "builtins.list": "list",
+    "builtins.dict": "json",
+    "decimal.Decimal": "decimal",
+    "array.array": "array",
 }
+# Types supported by `Env.list` `subcast`
+_SUBCAST_TYPES = {"str", "int", "bool", "float", "decimal"}
+
+
+class _BoundField(NamedTuple):
+    key: str
+    var: Var
+    # Callable that returns the default, from `dataclasses.field`
+    default_factory: Callable | None
+    required: bool
+
+
+def _with_default(var: Var, default: Any) -> Var:
+    return Var(
+        var.type, default=default, validate=var.validate, from_file=var.from_file, **var.kwds
+    )
+
+
+def _var_from_hint(hint: Any) -> Var:
+    """Return a `Var` for a field type hint of a class bound with
+    `Env.bind`."""
+    import types
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin is typing.Annotated:
+        for extra in args[1:]:
+            if isinstance(extra, Var):
+                return extra
+        return _var_from_hint(args[0])
+    if origin in (Union, getattr(types, "UnionType", Union)):
+        not_none = [arg for arg in args if arg is not type(None)]
+        if len(not_none) == 1 and len(args) == 2:
+            var = _var_from_hint(not_none[0])
+            return var if var.default is not _Missing else _with_default(var, None)
+    cls = origin or hint
+    cast_type = _HINT_TYPES.get(
+        f"{getattr(cls, '__module__', None)}.{getattr(cls, '__qualname__', None)}"
+    )
+    if cast_type == "list" and args:
+        subcast_type = _var_from_hint(args[0]).type if len(args) == 1 else None
+        if subcast_type in _SUBCAST_TYPES:
+            return Var("list", subcast=args[0])
+        return Var("json")
+    if cast_type is None:
+        raise TypeError(
+            f"Unsupported type hint {hint!r}. Declare the variable with Annotated[..., Var(...)]"
+        )
+    return Var(cast_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _bind_fields(cls: type) -> tuple[_BoundField, ...]:
+    """Return the fields of a dataclass or a TypedDict for `Env.bind`."""
+    hints = typing.get_type_hints(cls, include_extras=True)
+    if hasattr(cls, "__dataclass_fields__"):
+        import dataclasses
+
+        bound_fields = []
+        for field in dataclasses.fields(cls):
+            if not field.init:
+                continue
+            var = _var_from_hint(hints[field.name])
+            has_factory = field.default_factory is not dataclasses.MISSING
+            if field.default is not dataclasses.MISSING:
+                var = _with_default(var, field.default)
+            bound_fields.append(
+                _BoundField(
+                    field.name,
+                    var,
+                    field.default_factory if has_factory else None,  # type: ignore[arg-type]
+                    True,
+                )
+            )
+        return tuple(bound_fields)
+    if isinstance(cls, type) and issubclass(cls, dict) and hasattr(cls, "__required_keys__"):
+        return tuple(
+            _BoundField(key, _var_from_hint(hint), None, key in cls.__required_keys__)
+            for key, hint in hints.items()
+        )
+    raise TypeError(f"Can not bind {cls!r}: Expected a dataclass or a TypedDict")
+
+
+# `Env` instances that read the process environment, and the mapping they
+# read it from. `Env.overlay` replaces the mapping.
+_environ_envs: weakref.WeakSet[Env] = weakref.WeakSet()
+_environ: Mapping[str, str] = os.environ
+
+# Incremented when typenv sets variables in a source, i.e. in
+# `Env.read_env` and `Watcher`, to invalidate the indexes of `Env.scan`.
+_scan_generation = 0
+
+# Prefix stacks set by `Env.prefixed`, keyed by `Env` instance. Storing them
+# in a context variable lets threads and asyncio tasks share an `Env` without
+# seeing each other's prefixes.
+_context_prefixes: contextvars.ContextVar[Mapping[Env, list[str]]] = contextvars.ContextVar(
+    "_context_prefixes", default=_EMPTY_MAP
+)
 
 
 class Env:
     def __init__(
-        self, *, allowed_chars: Iterable[_Str] = _DEFAULT_NAME_CHARS, upper: _Bool = False
+        self,
+        *,
+        allowed_chars: Iterable[_Str] = _DEFAULT_NAME_CHARS,
+        upper: _Bool = False,
+        source: Mapping[_Str, _Str] | None = None,
+        json_loads: Callable[[_Str], Any] | None = None,
+        cache_dir: _Str | os.PathLike[_Str] | None = None,
+        memoize_validators: _Bool = False,
+        instrument: _Bool = False,
+        cast_cache: _Bool = False,
     ):
-        self._allowed_chars = allowed_chars
+        self._allowed_chars = frozenset(allowed_chars)
         self._upper = upper
-        self.prefix: _List[_Str] = []
-        self._parsed: dict[_Str, ParsedValue] = {}
+        # Validated names keyed by the prefixed name before uppercasing
+        self._name_cache: dict[_Str, _Str] = {}
+        if source is None:
+            source = _environ
+            _environ_envs.add(self)
+        self._source: Mapping[_Str, _Str] = source
+        self._json_loads = json_loads
+        # Typecast functions keyed by type name
+        self._casters: Mapping[_Str, Callable] = _cached_casters if cast_cache else _typecast_map
+        self._cache_dir = None if cache_dir is None else os.fspath(cache_dir)
+        # `(validator, type(value), value)` of validations that passed
+        self._passed_validations: set[tuple[Callable, type, Any]] | None = (
+            set() if memoize_validators else None
+        )
+        self._lazy_vars: _List[Lazy] = []
+        # `(source, _scan_generation, sorted names of source)`, built on
+        # first `scan`
+        self._scan_index: tuple[Mapping[_Str, _Str], int, _List[_Str]] | None = None
+        self._prefix: _List[_Str] = []
+        # Only single dict operations are done on `_parsed`. They are
+        # atomic, also on free-threaded builds, so typecast methods can be
+        # called concurrently without a lock. A `ChainMap` in children
+        # created by `child`.
+        self._parsed: MutableMapping[_Str, ParsedValue] = {}
+        self._parsed_view = MappingProxyType(self._parsed)
+        # Sorted names of `_parsed`, updated by `get_example`
+        self._sorted_index: _List[_Str] = []
+        # Typecast function and arguments of each read variable, used to
+        # re-read variables that a `Watcher` finds changed, and to show
+        # constraints in `get_example`
+        self._specs: MutableMapping[_Str, _ReadSpec] = {}
+        # Values parsed earlier, e.g. in another process, that are returned
+        # instead of reading the source
+        self._preparsed: Mapping[_Str, ParsedValue] = _EMPTY_MAP
+        self._instrumentation: _Instrumentation | None = None
+        self._instrument_always = instrument
+        if instrument:
+            self._instrument(True)
+        # Functions generated by `bind`, keyed by class and prefix
+        self._loaders: dict[tuple[type, tuple[_Str, ...]], tuple[Callable, Schema]] = {}
+        # .env file paths of values added by `read_env_layers`
+        self._origins: dict[_Str, _Str] = {}
 
     def _get_and_cast(
         self,
@@ -102,34 +819,202 @@ class Env:
         validate: Callable | Iterable[Callable],
         *,
         typecast_kwds: Mapping[_Str, Any] = _EMPTY_MAP,
+        from_file: _Bool = False,
+        timer: _ReadTimer | None = None,
+    ) -> _T | None:
+        name = self._preprocess_name(name)
+        if timer is not None:
+            timer.name_ns = timer.lap()
+        if callable(validate):
+            validate = (validate,)
+        source = self._source
+        if from_file and name + "_FILE" in source:
+            source = _SecretFile(source[name + "_FILE"])
+        return self._resolve(
+            source,
+            name,
+            cast_type,
+            self._casters[cast_type],
+            default,
+            validate,
+            typecast_kwds,
+            None,
+            timer,
+            from_file,
+        )
+
+    def _resolve(
+        self,
+        source: Mapping[_Str, _Str],
+        name: _Str,
+        cast_type: _Str,
+        caster: Callable,
+        default: type[_Missing] | None | _T,
+        validators: Iterable[Callable],
+        typecast_kwds: Mapping[_Str, Any],
+        pending: _List[_PendingValidation] | None = None,
+        timer: _ReadTimer | None = None,
+        from_file: _Bool = False,
     ) -> _T | None:
+        """Read, cast, validate and record a variable with a preprocessed
+        name.
+
+        If `pending` is given, append the value to it instead of
+        validating and recording. If `timer` is given, it is also the
+        source, and times the cast and validation. `from_file` is only
+        recorded, the caller reads the file.
+        """
         is_optional = default is not _Missing
 
-        name = self._preprocess_name(name)
+        preparsed = self._preparsed.get(name)
+        if (
+            preparsed is not None
+            and preparsed.type == cast_type
+            and preparsed.optional == is_optional
+        ):
+            self._parsed[name] = preparsed
+            return preparsed.value
 
+        self._specs[name] = (caster, default, validators, typecast_kwds, from_file)
         try:
-            uncast_value = os.environ[name]
+            uncast_value = source[name]
         except KeyError:
-            if default is _Missing:
-                raise Exception(f'Mandatory environment variable "{name}" is missing')
-            if default is None:
-                self._parsed[name] = ParsedValue(None, cast_type, is_optional)
+            if default is _Missing or default is None:
+                self._resolve_missing(name, cast_type, default, pending)
                 return None
             value = default
         else:
             try:
-                value = _typecast_map[cast_type](uncast_value, **typecast_kwds)
+                value = caster(uncast_value, **typecast_kwds)
             except Exception as e:
                 raise Exception(
                     f'Failed to cast "{uncast_value}" (variable name "{name}") to {cast_type}'
                 ) from e
+            if timer is not None:
+                timer.cast_ns = timer.lap()
 
-        self._validate(name, value, validate)
+        if pending is not None:
+            pending.append((name, value, validators, ParsedValue(value, cast_type, is_optional)))
+            return value  # type: ignore
+        self._validate(name, value, validators, self._passed_validations)
+        if timer is not None:
+            timer.validate_ns = timer.lap()
         self._parsed[name] = ParsedValue(value, cast_type, is_optional)
         # Ignore type checker. The typecast above assigns a value of `Any` type
         # to `value` making it very hard to prove that `value` is of type `_T`.
         return value  # type: ignore
 
+    def _resolve_missing(
+        self,
+        name: _Str,
+        cast_type: _Str,
+        default: type[_Missing] | None,
+        pending: _List[_PendingValidation] | None,
+    ) -> None:
+        """Raise if a missing variable is mandatory, or record `None` as
+        in `_resolve`."""
+        if default is _Missing:
+            raise Exception(f'Mandatory environment variable "{name}" is missing')
+        parsed = ParsedValue(None, cast_type, True)
+        if pending is not None:
+            pending.append((name, None, (), parsed))
+        else:
+            self._parsed[name] = parsed
+
+    def _get_and_cast_instrumented(self, *args: Any, **kwds: Any) -> Any:
+        """`_get_and_cast` with timing of name resolution. Replaces
+        `_get_and_cast` when instrumentation is enabled."""
+        return Env._get_and_cast(self, *args, timer=_ReadTimer(), **kwds)
+
+    def _resolve_instrumented(
+        self,
+        source: Mapping[_Str, _Str],
+        name: _Str,
+        cast_type: _Str,
+        caster: Callable,
+        default: type[_Missing] | None | _T,
+        validators: Iterable[Callable],
+        typecast_kwds: Mapping[_Str, Any],
+        pending: _List[_PendingValidation] | None = None,
+        timer: _ReadTimer | None = None,
+        from_file: _Bool = False,
+    ) -> _T | None:
+        """`_resolve` that times each phase and records a `ReadEvent`.
+        Replaces `_resolve` when instrumentation is enabled, so that
+        `_resolve` only reads the clock through a given `timer`."""
+        instrumentation: _Instrumentation = self._instrumentation  # type: ignore[assignment]
+        if timer is None:
+            timer = _ReadTimer()
+        timer.source = source
+        try:
+            value: _T | None = Env._resolve(
+                self,
+                timer,
+                name,
+                cast_type,
+                caster,
+                default,
+                validators,
+                typecast_kwds,
+                pending,
+                timer,
+                from_file,
+            )
+        except BaseException:
+            timer.outcome = "error"
+            # An exception from a hook must not replace the one of the read
+            with contextlib.suppress(Exception):
+                instrumentation.record(timer.event(name, cast_type))
+            raise
+        instrumentation.record(timer.event(name, cast_type))
+        return value
+
+    def add_hook(self, hook: Callable[[ReadEvent], None]) -> None:
+        """Call `hook` with a `ReadEvent` after each variable read.
+
+        Exceptions raised by `hook` propagate from the read, unless the
+        read itself failed. Enables instrumentation, see `Env.stats`.
+        """
+        self._instrument(True)
+        self._instrumentation.hooks.append(hook)  # type: ignore[union-attr]
+
+    def remove_hook(self, hook: Callable[[ReadEvent], None]) -> None:
+        """Remove a hook added with `Env.add_hook`.
+
+        Instrumentation is disabled when the last hook is removed,
+        unless the `Env` was created with `instrument=True`.
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            raise ValueError("Hook not found")
+        instrumentation.hooks.remove(hook)
+        if not instrumentation.hooks and not self._instrument_always:
+            self._instrument(False)
+
+    def stats(self) -> dict[_Str, VarStats]:
+        """Return read counters of each variable, collected while
+        instrumentation is enabled.
+
+        Instrumentation is enabled by `Env(instrument=True)` and by
+        `Env.add_hook`. When it is not, typecast methods have no
+        instrumentation overhead, and this returns an empty dict.
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
+
+    def _instrument(self, enable: _Bool) -> None:
+        """Enable or disable instrumentation by replacing `_resolve` and
+        `_get_and_cast` on this instance."""
+        if enable and self._instrumentation is None:
+            self._instrumentation = _Instrumentation()
+            self._resolve = self._resolve_instrumented  # type: ignore[method-assign]
+            self._get_and_cast = self._get_and_cast_instrumented  # type: ignore[method-assign]
+        elif not enable and self._instrumentation is not None:
+            self._instrumentation = None
+            del self._resolve
+            del self._get_and_cast
+
     @typing.overload
     def str(
         self,
@@ -137,11 +1022,17 @@ class Env:
         *,
         default: type[_Missing] | _Str = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Str: ...
 
     @typing.overload
     def str(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Str | None: ...
 
     def str(
@@ -150,17 +1041,20 @@ class Env:
         *,
         default: type[_Missing] | None | _Str = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Str | None:
-        return self._get_and_cast(name, "str", default, validate)
+        return self._get_and_cast(name, "str", default, validate, from_file=from_file)
 
     @typing.overload
     def bytes(
         self,
         name: _Str,
         *,
-        encoding: Literal["hex"],
+        encoding: _BytesEncoding,
+        mutable: _Bool = False,
         default: type[_Missing] | _Bytes = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bytes: ...
 
     @typing.overload
@@ -168,20 +1062,31 @@ class Env:
         self,
         name: _Str,
         *,
-        encoding: Literal["hex"],
+        encoding: _BytesEncoding,
+        mutable: _Bool = False,
         default: None,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bytes | None: ...
 
     def bytes(
         self,
         name: _Str,
         *,
-        encoding: Literal["hex"],
+        encoding: _BytesEncoding,
+        mutable: _Bool = False,
         default: type[_Missing] | None | _Bytes = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bytes | None:
-        return self._get_and_cast(name, "bytes", default, validate)
+        return self._get_and_cast(
+            name,
+            "bytes",
+            default,
+            validate,
+            typecast_kwds={"encoding": encoding, "mutable": mutable},
+            from_file=from_file,
+        )
 
     @typing.overload
     def int(
@@ -190,11 +1095,17 @@ class Env:
         *,
         default: type[_Missing] | _Int = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Int: ...
 
     @typing.overload
     def int(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Int | None: ...
 
     def int(
@@ -203,8 +1114,9 @@ class Env:
         *,
         default: type[_Missing] | None | _Int = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Int | None:
-        return self._get_and_cast(name, "int", default, validate)
+        return self._get_and_cast(name, "int", default, validate, from_file=from_file)
 
     @typing.overload
     def bool(
@@ -213,11 +1125,17 @@ class Env:
         *,
         default: type[_Missing] | _Bool = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bool: ...
 
     @typing.overload
     def bool(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bool | None: ...
 
     def bool(
@@ -226,8 +1144,9 @@ class Env:
         *,
         default: type[_Missing] | None | _Bool = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Bool | None:
-        return self._get_and_cast(name, "bool", default, validate)
+        return self._get_and_cast(name, "bool", default, validate, from_file=from_file)
 
     @typing.overload
     def float(
@@ -236,11 +1155,17 @@ class Env:
         *,
         default: type[_Missing] | _Float = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Float: ...
 
     @typing.overload
     def float(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Float | None: ...
 
     def float(
@@ -249,8 +1174,9 @@ class Env:
         *,
         default: type[_Missing] | None | _Float = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _Float | None:
-        return self._get_and_cast(name, "float", default, validate)
+        return self._get_and_cast(name, "float", default, validate, from_file=from_file)
 
     @typing.overload
     def decimal(
@@ -259,11 +1185,17 @@ class Env:
         *,
         default: type[_Missing] | D = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> D: ...
 
     @typing.overload
     def decimal(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> D | None: ...
 
     def decimal(
@@ -272,8 +1204,9 @@ class Env:
         *,
         default: type[_Missing] | None | D = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> D | None:
-        return self._get_and_cast(name, "decimal", default, validate)
+        return self._get_and_cast(name, "decimal", default, validate, from_file=from_file)
 
     def json(
         self,
@@ -281,11 +1214,19 @@ class Env:
         *,
         default: type[_Missing] | None | _JSONType = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> Any:
-        value = self._get_and_cast(name, "json", default, validate)
-        # Extra validation: make sure user provided default serializes to json
-        json.dumps(value)
-        return value
+        if default is not _Missing:
+            # Extra validation: make sure user provided default serializes to json
+            _check_json_serializable(default)
+        return self._get_and_cast(
+            name,
+            "json",
+            default,
+            validate,
+            from_file=from_file,
+            typecast_kwds=self._typecast_kwds("json", _EMPTY_MAP),
+        )
 
     @typing.overload
     def list(
@@ -294,11 +1235,17 @@ class Env:
         *,
         default: type[_Missing] | _List = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _List[_Str]: ...
 
     @typing.overload
     def list(
-        self, name: _Str, *, default: None, validate: Callable | Iterable[Callable] = ()
+        self,
+        name: _Str,
+        *,
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
     ) -> _List[_Str] | None: ...
 
     @typing.overload
@@ -308,6 +1255,7 @@ class Env:
         *,
         default: type[_Missing] | _List[_T] = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
         subcast: Callable[..., _T],
     ) -> _List[_T]: ...
 
@@ -318,6 +1266,7 @@ class Env:
         *,
         default: None,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
         subcast: Callable[..., _T],
     ) -> _List[_T] | None: ...
 
@@ -327,82 +1276,772 @@ class Env:
         *,
         default: type[_Missing] | None | _List[_T] = _Missing,
         validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
         subcast: Callable = _Str,
     ) -> _List | None:
-        assert subcast in {_Str, _Int, _Bool, _Float, D}
-        # Do lower() so that "Decimal" converts to "decimal"
-        subcast_func = _typecast_map[subcast.__name__.lower()]
         return self._get_and_cast(
-            name, "list", default, validate, typecast_kwds={"subcast": subcast_func}
+            name,
+            "list",
+            default,
+            validate,
+            from_file=from_file,
+            typecast_kwds={"subcast": _subcast_func(subcast)},
         )
 
-    @contextlib.contextmanager
-    def prefixed(self, prefix: _Str) -> Generator[None, None, None]:
-        old_prefix = self.prefix.copy()
-        self.prefix.append(prefix)
-        try:
-            yield
-        finally:
-            self.prefix = old_prefix
+    @typing.overload
+    def array(
+        self,
+        name: _Str,
+        *,
+        typecode: _Str = "q",
+        sep: _Str = ",",
+        default: type[_Missing] | _Array = _Missing,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
+    ) -> _Array: ...
 
-    @staticmethod
-    def read_env(path: _Str = ".env", override: _Bool = False) -> _Bool:
+    @typing.overload
+    def array(
+        self,
+        name: _Str,
+        *,
+        typecode: _Str = "q",
+        sep: _Str = ",",
+        default: None,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
+    ) -> _Array | None: ...
+
+    def array(
+        self,
+        name: _Str,
+        *,
+        typecode: _Str = "q",
+        sep: _Str = ",",
+        default: type[_Missing] | None | _Array = _Missing,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: _Bool = False,
+    ) -> _Array | None:
+        return self._get_and_cast(
+            name,
+            "array",
+            default,
+            validate,
+            from_file=from_file,
+            typecast_kwds={"typecode": typecode, "sep": sep},
+        )
+
+    @property
+    def prefix(self) -> _List[_Str]:
+        """The stack of name prefixes.
+
+        Inside a `prefixed` block, this is local to the current thread
+        or asyncio task. Otherwise it is shared.
+        """
+        return _context_prefixes.get().get(self, self._prefix)
+
+    @prefix.setter
+    def prefix(self, prefix: _List[_Str]) -> None:
+        context_prefixes = _context_prefixes.get()
+        if self in context_prefixes:
+            _context_prefixes.set({**context_prefixes, self: prefix})
+        else:
+            self._prefix = prefix
+
+    @contextlib.contextmanager
+    def prefixed(self, prefix: _Str) -> Generator[None, None, None]:
+        with self._prefix_as([*self.prefix, prefix]):
+            yield
+
+    @contextlib.contextmanager
+    def _prefix_as(self, prefix: Iterable[_Str]) -> Generator[None, None, None]:
+        token = _context_prefixes.set({**_context_prefixes.get(), self: _List(prefix)})
+        try:
+            yield
+        finally:
+            _context_prefixes.reset(token)
+
+    def child(self, prefix: _Str) -> Env:
+        """Return an `Env` that reads names prefixed with `prefix`.
+
+        The child shares the source, options, name cache and parsed
+        values of this `Env` without copying them, so creating one is
+        cheap. Values that the child parses are stored in the child
+        only, and values parsed by this `Env`, also later ones, are
+        visible in the child's `dump`, `parsed_view` and `get_example`.
+        """
+        child = object.__new__(type(self))
+        state = child.__dict__
+        state.update(self.__dict__)
+        # Instrumented methods are bound to this `Env`
+        state.pop("_resolve", None)
+        state.pop("_get_and_cast", None)
+        child._prefix = [*self.prefix, prefix]
+        parsed = self._parsed
+        maps = parsed.maps if isinstance(parsed, collections.ChainMap) else [parsed]
+        child._parsed = collections.ChainMap({}, *maps)
+        child._parsed_view = MappingProxyType(child._parsed)
+        child._sorted_index = []
+        specs = self._specs
+        child._specs = collections.ChainMap(
+            {}, *(specs.maps if isinstance(specs, collections.ChainMap) else [specs])
+        )
+        child._lazy_vars = []
+        child._instrumentation = None
+        if self._instrument_always:
+            child._instrument(True)
+        if self in _environ_envs:
+            _environ_envs.add(child)
+        return child
+
+    @property
+    def lazy(self) -> _LazyEnv:
+        """Typecast methods that defer reading a variable to first
+        access."""
+        return _LazyEnv(self)
+
+    def resolve_all(self) -> None:
+        """Resolve all variables declared via `Env.lazy`.
+
+        Raise the first error encountered.
+        """
+        for lazy_var in self._lazy_vars:
+            lazy_var.get()
+
+    @staticmethod
+    def register_type(
+        name: _Str,
+        caster: Callable[[_Str], Any],
+        *,
+        python_type: type | None = None,
+        immutable: _Bool = False,
+    ) -> None:
+        """Add a type that `Var`, `Env.scan` and a new typecast method
+        named `name` cast with `caster`.
+
+        If `python_type` is given, it is supported as a `list` subcast,
+        and as a field type hint in `Env.bind`. If `immutable` is true,
+        results of `caster` can not be modified, and are cached by
+        `Env(cast_cache=True)`.
+        """
+        if not name.isidentifier() or name.startswith("_"):
+            raise ValueError(f'Invalid type name "{name}"')
+        if name in _typecast_map or hasattr(Env, name):
+            raise ValueError(f'Type "{name}" already exists')
+        if python_type is not None:
+            hint = f"{python_type.__module__}.{python_type.__qualname__}"
+            if python_type in _subcast_map or hint in _HINT_TYPES:
+                raise ValueError(f'Python type "{hint}" already has a type')
+        _typecast_map[name] = caster
+        if immutable:
+            _IMMUTABLE_CASTS.add(name)
+        if python_type is not None:
+            _subcast_map[python_type] = caster
+            if immutable:
+                _IMMUTABLE_SUBCASTS.add(caster)
+            _HINT_TYPES[hint] = name
+            _SUBCAST_TYPES.add(name)
+        setattr(Env, name, _make_typecast_method(name))
+        setattr(_LazyEnv, name, _make_lazy_typecast_method(name))
+
+    @staticmethod
+    @contextlib.contextmanager
+    def overlay(values: Mapping[_Str, _Str]) -> Generator[None, None, None]:
+        """Read `values` in place of environment variables within the
+        `with` block, without modifying the environment.
+
+        Applies to all `Env` instances that were created without a
+        `source`, also after `read_env_layers` has added layers to it.
+        Changes to `values` are visible within the block.
+        """
+        global _environ
+
+        previous = _environ
+        layered: Mapping[_Str, _Str] = collections.ChainMap(
+            values, previous  # type: ignore[arg-type]
+        )
+        _environ = layered
+        for env in _environ_envs:
+            env._source = _replace_layer(env._source, previous, layered)
+        try:
+            yield
+        finally:
+            for env in _environ_envs:
+                env._source = _replace_layer(env._source, layered, previous)
+            _environ = previous
+
+    @staticmethod
+    def snapshot() -> dict[_Str, _Str]:
+        """Return a copy of the current environment as a plain dict.
+
+        Use as `Env(source=Env.snapshot())` to read all values from the
+        copy, which is faster than reading `os.environ` repeatedly.
+        """
+        return os.environ.copy()
+
+    @staticmethod
+    def read_env(
+        path: _Str = ".env",
+        override: _Bool = False,
+        *,
+        target: MutableMapping[_Str, _Str] | None = None,
+    ) -> _Bool:
         """Load environment variables from a file.
 
         If `path` is a file, load it to ENV. If not, recursively walk up
         in dir tree and look for a file with that name, starting from
         current working directory. Return a bool representing whether a
         file was found.
+
+        The variables are set in `target`, which defaults to
+        `os.environ`.
         """
+        from typenv import _dotenv
+
         if not os.path.isfile(path):
-            path = dotenv.find_dotenv(path, usecwd=True)
+            path = _dotenv.find(path)
             if not path:
                 return False
-        dotenv.load_dotenv(path, override=override)
+        _dotenv.load(path, os.environ if target is None else target, override=override)
+        _invalidate_scan_indexes()
         return True
 
+    def read_env_layers(self, paths: Iterable[_Str], override: _Bool = False) -> _List[_Str]:
+        """Read variables from layered .env files without setting them
+        in the environment.
+
+        Later files take precedence over earlier ones. The merged values
+        are added as a layer below the source of this `Env`, or above it
+        if `override` is true. Files that do not exist are skipped.
+        Return the paths of files that were read.
+        """
+        from typenv import _dotenv
+
+        source = self._source
+        merged: dict[_Str, _Str] = {}
+        origins: dict[_Str, _Str] = {}
+        found = []
+        for path in paths:
+            try:
+                f = open(path, encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with f:
+                environ = {**source, **merged} if override else {**merged, **source}
+                values = _dotenv.resolve(_dotenv.parse(f), environ, override=override)
+            found.append(path)
+            for name, value in values.items():
+                if value is not None:
+                    merged[name] = value
+                    origins[name] = path
+        if not found:
+            return found
+        if not override:
+            origins = {name: path for name, path in origins.items() if name not in source}
+        layers = [merged, source] if override else [source, merged]
+        self._source = collections.ChainMap(*layers)  # type: ignore[arg-type]
+        # Replace rather than update, because children share `_origins`
+        self._origins = {**self._origins, **origins}
+        return found
+
+    def watch(
+        self,
+        path: _Str = ".env",
+        on_change: Callable[[_Str, ParsedValue, ParsedValue], None] | None = None,
+        *,
+        on_error: Callable[[_Str, Exception], None] | None = None,
+        interval: _Float = 1.0,
+        override: _Bool = False,
+    ) -> Watcher:
+        """Poll a .env file for changes in a background thread.
+
+        Changed variables are set in the source of this `Env`, which
+        must be mutable. Variables that have been read are read again,
+        and `on_change` is called with the name and the old and new
+        `ParsedValue` if the parsed value changed. A variable that fails
+        to cast or validate keeps its old value, and is passed to
+        `on_error` with the exception.
+
+        As in `read_env`, variables that were set elsewhere than in the
+        file when the watcher was created are not changed, unless
+        `override` is true. Overridden values are restored when the file
+        no longer defines them.
+        """
+        watcher = Watcher(self, path, on_change, on_error, override)
+        watcher.start(interval)
+        return watcher
+
     def get_example(self) -> _Str:
-        env_example = ""
-        for k, v in sorted(self.dump().items()):
-            value_example = v.type
-            if v.optional:
+        return "".join(self._example_lines())
+
+    def write_example(self, fileobj: typing.TextIO) -> None:
+        """Write the output of `get_example` to a text file object line
+        by line."""
+        fileobj.writelines(self._example_lines())
+
+    def _example_lines(self) -> Generator[_Str, None, None]:
+        parsed = self._parsed
+        specs = self._specs
+        for name in self._sorted_names():
+            parsed_value = parsed[name]
+            value_example = parsed_value.type
+            if parsed_value.optional:
                 value_example = f"Optional[{value_example}]"
-            env_example += f"{k}={value_example}\n"
-        return env_example
+            line = f"{name}={value_example}"
+            spec = specs.get(name)
+            if spec is not None:
+                # Constraints compiled by `compile` are `_AllOf.check`
+                owners = (getattr(validator, "__self__", validator) for validator in spec[2])
+                constraints = [
+                    repr(constraint)
+                    for owner in owners
+                    if isinstance(owner, _Constraint)
+                    for constraint in owner._parts()
+                ]
+                if constraints:
+                    line += f"  # {', '.join(constraints)}"
+            yield line + "\n"
+
+    def _sorted_names(self) -> _List[_Str]:
+        """Return the names in `_parsed` in sorted order.
+
+        Names are never removed from `_parsed`, and a dict keeps
+        insertion order, so names added since the last call are the
+        ones after the previous length.
+        """
+        if not isinstance(self._parsed, dict):
+            # The order of a child's `ChainMap` changes when the parent
+            # adds names
+            return sorted(self._parsed)
+        index = self._sorted_index
+        if len(index) != len(self._parsed):
+            new_names = _List(self._parsed)[len(index) :]
+            index = index.copy()
+            for name in new_names:
+                bisect.insort(index, name)
+            # Replace rather than modify in place so that concurrent
+            # callers never see a partially updated list
+            self._sorted_index = index
+        return index
+
+    def compile(self, spec: Mapping[_Str, _Str | Var]) -> Schema:
+        """Compile a mapping of names to variable declarations.
+
+        A declaration is either a type name (e.g. `"int"`) or a `Var`.
+        Names are resolved using the prefix that is active when this
+        method is called.
+        """
+        compiled_vars = []
+        for key, var in spec.items():
+            if isinstance(var, _Str):
+                var = Var(var)
+            if var.type == "json" and var.default is not _Missing:
+                # Extra validation: make sure user provided default serializes to json
+                _check_json_serializable(var.default)
+            validators = var.validate
+            name = self._preprocess_name(key)
+            compiled_vars.append(
+                _CompiledVar(
+                    key,
+                    name,
+                    var.type,
+                    self._casters[var.type],
+                    var.default,
+                    _compile_constraints((validators,) if callable(validators) else validators),
+                    self._typecast_kwds(var.type, var.kwds),
+                    name + "_FILE" if var.from_file else None,
+                )
+            )
+        return Schema(compiled_vars)
+
+    def load(
+        self,
+        spec: Mapping[_Str, _Str | Var] | Schema,
+        *,
+        concurrent_validation: _Bool = False,
+    ) -> dict[_Str, Any]:
+        """Read, cast and validate many variables in one pass.
+
+        Return a dict that maps the keys of `spec` to parsed values.
+
+        If `concurrent_validation` is true, validators are run in a
+        thread pool after all variables are cast, and all validation
+        failures are reported in one exception.
+        """
+        if not isinstance(spec, Schema):
+            spec = self.compile(spec)
+        return self._load_with_files(spec, self._read_files(spec), concurrent_validation)
+
+    async def aload(
+        self,
+        spec: Mapping[_Str, _Str | Var] | Schema,
+        *,
+        concurrent_validation: _Bool = False,
+    ) -> dict[_Str, Any]:
+        """Like `Env.load`, but read the files of `from_file` variables
+        concurrently in worker threads."""
+        import asyncio
+
+        if not isinstance(spec, Schema):
+            spec = self.compile(spec)
+        paths = self._secret_paths(spec)
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(_read_secret_file, name, path) for name, path in paths.items())
+        )
+        return self._load_with_files(spec, dict(zip(paths, contents)), concurrent_validation)
+
+    def _secret_paths(self, spec: Schema) -> dict[_Str, _Str]:
+        """Return file paths of `from_file` variables in `spec`, keyed by
+        variable name."""
+        if not spec._file_vars:
+            return {}
+        source = self._source
+        return {
+            var.name: source[var.file_name]  # type: ignore[index]
+            for var in spec._file_vars
+            if var.file_name in source
+        }
+
+    def _read_files(self, spec: Schema) -> dict[_Str, _Str]:
+        """Read the files of `from_file` variables in `spec`, keyed by
+        variable name."""
+        return {
+            name: _read_secret_file(name, path) for name, path in self._secret_paths(spec).items()
+        }
+
+    def _load_with_files(
+        self, spec: Schema, files: dict[_Str, _Str], concurrent_validation: _Bool
+    ) -> dict[_Str, Any]:
+        source: Mapping[_Str, _Str] = self._source
+        if files:
+            source = {**source, **files}
+        # Values read from files are usually secrets, which are not
+        # written to the cache
+        if self._cache_dir is not None and not spec._file_vars:
+            return self._load_cached(spec, source, self._cache_dir, concurrent_validation)
+        return self._load(spec, source, concurrent_validation)
+
+    def _load(
+        self, spec: Schema, source: Mapping[_Str, _Str], concurrent_validation: _Bool = False
+    ) -> dict[_Str, Any]:
+        pending: _List[_PendingValidation] | None = [] if concurrent_validation else None
+        resolve = self._resolve
+        values = {
+            var.key: resolve(
+                source,
+                var.name,
+                var.type,
+                var.caster,
+                var.default,
+                var.validators,
+                var.typecast_kwds,
+                pending,
+                None,
+                var.file_name is not None,
+            )
+            for var in spec._vars
+        }
+        if pending:
+            self._validate_concurrently(pending)
+        return values
+
+    def bind(self, cls: type[_T]) -> _T:
+        """Read the fields of a dataclass or a TypedDict from the
+        environment and return an instance of it.
+
+        Variable names are the field names in upper case. Field type
+        hints choose the typecast method: `str`, `int`, `bool`,
+        `float`, `Decimal`, `list[...]`, `dict` and `array.array` are
+        supported, and `Optional` makes the default None. Use
+        `Annotated[..., Var(...)]` to declare a field explicitly.
+        """
+        key = (cls, tuple(self.prefix))
+        try:
+            loader, schema = self._loaders[key]
+        except KeyError:
+            loader, schema = self._loaders[key] = self._make_loader(cls)
+        source: Mapping[_Str, _Str] = self._source
+        files = self._read_files(schema)
+        if files:
+            source = {**source, **files}
+        return loader(self._resolve, source)
+
+    def _make_loader(self, cls: type) -> tuple[Callable, Schema]:
+        """Generate a function that reads and returns an instance of a
+        class for `Env.bind`, and return it with the schema of the
+        class."""
+        bound_fields = _bind_fields(cls)
+        schema = self.compile({field.key.upper(): field.var for field in bound_fields})
+        namespace: dict[_Str, Any] = {"cls": cls}
+        is_dataclass = hasattr(cls, "__dataclass_fields__")
+        values = []
+        optional_values = []
+        for i, (field, var) in enumerate(zip(bound_fields, schema._vars)):
+            namespace.update(
+                {
+                    f"key_{i}": field.key,
+                    f"name_{i}": var.name,
+                    f"type_{i}": var.type,
+                    f"caster_{i}": var.caster,
+                    f"default_{i}": field.default_factory or var.default,
+                    f"validators_{i}": var.validators,
+                    f"kwds_{i}": var.typecast_kwds,
+                }
+            )
+            default = f"default_{i}()" if field.default_factory else f"default_{i}"
+            from_file = ", None, None, True" if var.file_name is not None else ""
+            value = (
+                f"resolve(source, name_{i}, type_{i}, caster_{i}, {default}, validators_{i},"
+                f" kwds_{i}{from_file})"
+            )
+            if is_dataclass:
+                values.append(f"        {field.key}={value},")
+            elif field.required:
+                values.append(f"        key_{i}: {value},")
+            else:
+                optional_values.append(
+                    f"    if name_{i} in source:\n        result[key_{i}] = {value}"
+                )
+        if is_dataclass:
+            lines = ["    return cls(", *values, "    )"]
+        else:
+            lines = ["    result = {", *values, "    }", *optional_values, "    return result"]
+        code = "\n".join(["def load(resolve, source):", *lines])
+        exec(code, namespace)
+        return namespace["load"], schema
+
+    def _validate_concurrently(self, pending: _List[_PendingValidation]) -> None:
+        """Validate in a thread pool, and record the parsed values if all
+        are valid."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        passed = self._passed_validations
+
+        def validate(item: _PendingValidation) -> Exception | None:
+            name, value, validators, _ = item
+            try:
+                self._validate(name, value, validators, passed)
+            except Exception as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor() as executor:
+            errors = [e for e in executor.map(validate, pending) if e is not None]
+        if errors:
+            # Include the causes, which the traceback of a single error
+            # from `_validate` would show
+            raise Exception(
+                "\n".join(str(e) if e.__cause__ is None else f"{e}: {e.__cause__}" for e in errors)
+            )
+        for name, _, _, parsed in pending:
+            self._parsed[name] = parsed
+
+    def _load_cached(
+        self,
+        spec: Schema,
+        source: Mapping[_Str, _Str],
+        cache_dir: _Str,
+        concurrent_validation: _Bool,
+    ) -> dict[_Str, Any]:
+        """Load `spec`, reusing the values of an earlier `load` if the
+        declarations and all raw values are unchanged."""
+        import hashlib
+        import pickle
+
+        raw_values = repr([source.get(var.name) for var in spec._vars])
+        values_digest = hashlib.sha256(raw_values.encode()).digest()
+        path = os.path.join(cache_dir, spec._spec_digest() + ".pickle")
+        try:
+            with open(path, "rb") as f:
+                if not _is_private(f):
+                    raise OSError(f"{path} can be written by other users")
+                cached_digest, parsed = pickle.load(f)
+        except Exception:
+            # Missing, unreadable, not private or written by an incompatible
+            # version
+            cached_digest = None
+        if cached_digest == values_digest:
+            self._parsed.update(parsed)
+            self._specs.update(
+                (
+                    var.name,
+                    (
+                        var.caster,
+                        var.default,
+                        var.validators,
+                        var.typecast_kwds,
+                        var.file_name is not None,
+                    ),
+                )
+                for var in spec._vars
+            )
+            if self._instrumentation is not None:
+                for name, parsed_value in parsed.items():
+                    self._instrumentation.record(
+                        ReadEvent(name, parsed_value.type, "cached", 0, 0, 0, 0)
+                    )
+            return {var.key: parsed[var.name].value for var in spec._vars}
+
+        values = self._load(spec, source, concurrent_validation)
+        parsed = {var.name: self._parsed[var.name] for var in spec._vars}
+        try:
+            data = pickle.dumps((values_digest, parsed), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # A default value that can not be pickled
+            return values
+        _write_atomic(path, data)
+        return values
+
+    def scan(
+        self,
+        prefix: _Str,
+        cast: _Str = "str",
+        *,
+        validate: Callable | Iterable[Callable] = (),
+        refresh: _Bool = False,
+        **typecast_kwds: Any,
+    ) -> dict[_Str, Any]:
+        """Read all variables whose name starts with `prefix`.
+
+        `cast` is the name of a typecast method, and `typecast_kwds` its
+        typecast specific keyword arguments. Return a dict that maps
+        names with the prefix removed to parsed values. Names with
+        characters that are not allowed are skipped.
+
+        Names are looked up in an index of the names in the source when
+        the index was built. It is rebuilt when the source is replaced,
+        e.g. by `overlay`, or variables are set by `read_env` or a
+        `Watcher`, and if `refresh` is true. Variables added to the
+        source otherwise are not found until then.
+        """
+        prefix = self._preprocess_name(prefix)
+        validators = (validate,) if callable(validate) else tuple(validate)
+        caster = self._casters[cast]
+        caster_kwds = self._typecast_kwds(cast, typecast_kwds)
+        source = self._source
+        index = self._scan_names(source, refresh)
+
+        values: dict[_Str, Any] = {}
+        for i in range(bisect.bisect_left(index, prefix), len(index)):
+            name = index[i]
+            if not name.startswith(prefix):
+                break
+            if name == prefix or name not in source or not self._allowed_chars.issuperset(name):
+                continue
+            values[name[len(prefix) :]] = self._resolve(
+                source, name, cast, caster, _Missing, validators, caster_kwds
+            )
+        return values
+
+    def _scan_names(self, source: Mapping[_Str, _Str], refresh: _Bool) -> _List[_Str]:
+        scan_index = self._scan_index
+        if (
+            refresh
+            or scan_index is None
+            or scan_index[0] is not source
+            or scan_index[1] != _scan_generation
+        ):
+            # Comparing the names, or even the number of names, is O(n)
+            # for `os.environ` and `ChainMap`s, so is not done per call
+            scan_index = self._scan_index = (source, _scan_generation, sorted(source))
+        return scan_index[2]
+
+    def freeze(self) -> FrozenEnv:
+        """Return the values parsed so far as an immutable, picklable
+        object."""
+        return FrozenEnv(tuple(self._parsed.items()))
+
+    @classmethod
+    def from_frozen(cls, frozen: FrozenEnv, **kwds: Any) -> Env:
+        """Create an `Env` that returns the values in `frozen`.
+
+        Keyword arguments are passed to `Env`. A typecast method call
+        for a name in `frozen` returns the frozen value without reading,
+        casting or validating, if the type and optionality match.
+        """
+        env = cls(**kwds)
+        env._preparsed = dict(frozen.parsed)
+        env._parsed.update(env._preparsed)
+        return env
 
     def dump(self) -> dict[_Str, ParsedValue]:
-        return self._parsed.copy()
+        return dict(self._parsed)
+
+    def parsed_view(self) -> Mapping[_Str, ParsedValue]:
+        """Return a read-only, live view of the parsed values.
+
+        Unlike `dump`, this does not copy.
+        """
+        return self._parsed_view
+
+    def dump_origins(self) -> dict[_Str, _Str]:
+        """Return the .env file path that each parsed value was read
+        from, for values read from layers added by `read_env_layers`."""
+        origins = self._origins
+        return {name: origins[name] for name in self._parsed if name in origins}
+
+    def _typecast_kwds(self, cast_type: _Str, kwds: Mapping[_Str, Any]) -> Mapping[_Str, Any]:
+        """Convert typecast method keyword arguments to typecast function
+        keyword arguments."""
+        if cast_type == "list" and "subcast" in kwds:
+            return {**kwds, "subcast": _subcast_func(kwds["subcast"])}
+        if cast_type == "json":
+            return {"loads": self._json_loads or _default_json_loads(), **kwds}
+        return kwds
 
     def _preprocess_name(self, name: _Str) -> _Str:
-        name = "".join(self.prefix) + name
+        prefix = self.prefix
+        if prefix:
+            name = "".join(prefix) + name
+        try:
+            return self._name_cache[name]
+        except KeyError:
+            pass
 
+        raw_name = name
         if self._upper:
             name = name.upper()
         self._validate_name(name)
+        if len(self._name_cache) < _NAME_CACHE_SIZE:
+            self._name_cache[raw_name] = name
         return name
 
     @staticmethod
-    def _validate(name: _Str, value: Any, validators: Callable | Iterable[Callable]) -> None:
-        if callable(validators):
-            validators = (validators,)
+    def _validate(
+        name: _Str,
+        value: Any,
+        validators: Iterable[Callable],
+        passed: set[tuple[Callable, type, Any]] | None = None,
+    ) -> None:
+        """Run validators on a value.
 
-        exc_to_raise = Exception(
-            f'Invalid value for "{name}": Value did not pass custom validator'
-        )
+        If `passed` is given, skip validations that it contains, and add
+        validations that pass to it.
+        """
         for validator in validators:
+            if passed is not None:
+                key = (validator, type(value), value)
+                try:
+                    if key in passed:
+                        continue
+                except TypeError:
+                    # Unhashable value
+                    passed = None
             try:
                 validator_result = validator(value)
             except Exception as e:
-                raise exc_to_raise from e
+                raise _invalid_value_error(name) from e
             if validator_result is False:
-                raise exc_to_raise
+                raise _invalid_value_error(name)
+            if passed is not None and len(passed) < _VALIDATION_CACHE_SIZE:
+                passed.add(key)
 
     def _validate_name(self, name: _Str) -> None:
         if not name:
             raise ValueError(
                 'Invalid name "": Environment variable name can not be an empty string'
             )
-        if any(c not in self._allowed_chars for c in name):
+        if not self._allowed_chars.issuperset(name):
             raise ValueError(
                 f'Invalid name "{name}": Environment variable name contains invalid character(s)'
             )
@@ -410,3 +2049,476 @@ class Env:
             raise ValueError(
                 f'Invalid name "{name}": Environment variable name can not start with a number'
             )
+
+
+class _Instrumentation:
+    """Hooks and read counters of an instrumented `Env`."""
+
+    def __init__(self) -> None:
+        import threading
+
+        self.hooks: list[Callable[[ReadEvent], None]] = []
+        # Counters in `VarStats` field order, keyed by variable name
+        self._counters: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: ReadEvent) -> None:
+        outcome = event.outcome
+        with self._lock:
+            counters = self._counters.get(event.name)
+            if counters is None:
+                counters = self._counters[event.name] = [0, 0, 0, 0, 0]
+            counters[0] += 1
+            if outcome == "cached":
+                counters[1] += 1
+            elif outcome == "default":
+                counters[2] += 1
+            elif outcome == "error":
+                counters[3] += 1
+            counters[4] += event.name_ns + event.lookup_ns + event.cast_ns + event.validate_ns
+        for hook in self.hooks:
+            hook(event)
+
+    def stats(self) -> dict[str, VarStats]:
+        with self._lock:
+            return {name: VarStats(*counters) for name, counters in self._counters.items()}
+
+
+class _LookupSource(Mapping[str, str]):
+    """A source of a single read, that `Env._resolve` only looks a name
+    up in."""
+
+    def __iter__(self) -> Iterator[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    def __len__(self) -> int:
+        raise NotImplementedError  # pragma: no cover
+
+
+class _ReadTimer(_LookupSource):
+    """Times the phases of a read of an instrumented `Env`.
+
+    Passed to `Env._resolve` in place of `source` to time the lookup,
+    which also sets `outcome`.
+    """
+
+    def __init__(self) -> None:
+        self.source: Mapping[str, str] = _EMPTY_MAP
+        self.outcome = "cached"
+        self.name_ns = self.lookup_ns = self.cast_ns = self.validate_ns = 0
+        self._mark = time.perf_counter_ns()
+
+    def lap(self) -> int:
+        """Return nanoseconds since the previous call, or since
+        creation."""
+        now = time.perf_counter_ns()
+        elapsed = now - self._mark
+        self._mark = now
+        return elapsed
+
+    def __getitem__(self, name: str) -> str:
+        self.lap()
+        try:
+            value = self.source[name]
+        except KeyError:
+            self.outcome = "default"
+            raise
+        finally:
+            self.lookup_ns = self.lap()
+        self.outcome = "value"
+        return value
+
+    def event(self, name: str, cast_type: str) -> ReadEvent:
+        return ReadEvent(
+            name,
+            cast_type,
+            self.outcome,
+            self.name_ns,
+            self.lookup_ns,
+            self.cast_ns,
+            self.validate_ns,
+        )
+
+
+class _SecretFile(_LookupSource):
+    """A source with the value of a variable read from `path` on lookup,
+    so that reading the file is timed and recorded like a lookup."""
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __getitem__(self, name: str) -> str:
+        return _read_secret_file(name, self._path)
+
+
+def _invalid_value_error(name: str) -> Exception:
+    return Exception(f'Invalid value for "{name}": Value did not pass custom validator')
+
+
+def _read_secret_file(name: str, path: str) -> str:
+    """Read a file named by the `<name>_FILE` variable, without trailing
+    newlines."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().rstrip("\r\n")
+    except (OSError, UnicodeDecodeError) as e:
+        raise Exception(f'Failed to read "{path}" (variable name "{name}_FILE")') from e
+
+
+def _is_private(f: typing.BinaryIO) -> bool:
+    """Return whether only the current user can have written to file
+    object `f`."""
+    if not hasattr(os, "getuid"):  # pragma: no cover
+        # Windows, where files are private to the user by default
+        return True
+    stat = os.fstat(f.fileno())
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write `data` to `path` so that readers never see a partial file.
+
+    Errors are ignored.
+    """
+    import tempfile
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+
+
+class Watcher:
+    """Reloads a .env file when it changes. Created by `Env.watch`."""
+
+    def __init__(
+        self,
+        env: Env,
+        path: str,
+        on_change: Callable[[str, ParsedValue, ParsedValue], None] | None,
+        on_error: Callable[[str, Exception], None] | None,
+        override: bool,
+    ):
+        if not isinstance(env._source, MutableMapping):
+            raise TypeError("Env source must be a mutable mapping")
+        self._env = env
+        self._path = path
+        self._on_change = on_change
+        self._on_error = on_error
+        self._override = override
+        # Names whose value in the source comes from the file. Other names
+        # were set elsewhere, and are only changed if `override` is true.
+        self._owned: set[str] = set()
+        # Values set elsewhere of names that the file overrides, restored
+        # when the file no longer defines them
+        self._shadowed: dict[str, str] = {}
+        self._signature = self._stat()
+        self._values = self._read()
+        source = env._source
+        self._owned.update(k for k, v in self._values.items() if source.get(k, v) == v)
+        self._poller: tuple[threading.Event, threading.Thread] | None = None
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> dict[str, str]:
+        from typenv import _dotenv
+
+        owned = self._owned
+        environ = {k: v for k, v in self._env._source.items() if k not in owned}
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                values = _dotenv.resolve(_dotenv.parse(f), environ, override=self._override)
+        except OSError:
+            return {}
+        return {k: v for k, v in values.items() if v is not None}
+
+    def check(self) -> None:
+        """Reload the file if it has changed since the last check.
+
+        Called periodically by the background thread.
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return
+        self._signature = signature
+        old_values = self._values
+        self._values = values = self._read()
+        for name in old_values.keys() | values.keys():
+            if old_values.get(name) != values.get(name):
+                self._update(name, values.get(name))
+
+    def _update(self, name: str, raw_value: str | None) -> None:
+        env = self._env
+        source: MutableMapping[str, str] = env._source  # type: ignore[assignment]
+        old_raw_value = source.get(name)
+        if not self._claim(name, old_raw_value):
+            return
+        if raw_value is None:
+            raw_value = self._shadowed.get(name)
+        _set_or_delete(source, name, raw_value)
+        if old_raw_value is None:
+            _invalidate_scan_indexes()
+        old = env._parsed.get(name)
+        spec = env._specs.get(name)
+        if old is None or spec is None:
+            return
+        try:
+            self._reread(source, name, old.type, spec)
+        except Exception as e:
+            _set_or_delete(source, name, old_raw_value)
+            if self._on_error is not None:
+                self._on_error(name, e)
+            return
+        new = env._parsed[name]
+        if self._on_change is not None and new != old:
+            self._on_change(name, old, new)
+
+    def _reread(
+        self, source: Mapping[str, str], name: str, cast_type: str, spec: _ReadSpec
+    ) -> None:
+        caster, default, validators, typecast_kwds, from_file = spec
+        if from_file and name + "_FILE" in source:
+            # The value in the file takes precedence over `source[name]`
+            source = _SecretFile(source[name + "_FILE"])
+        self._env._resolve(
+            source,
+            name,
+            cast_type,
+            caster,
+            default,
+            validators,
+            typecast_kwds,
+            None,
+            None,
+            from_file,
+        )
+
+    def _claim(self, name: str, raw_value: str | None) -> bool:
+        """Return whether the file may set `name`, whose value in the
+        source is `raw_value`."""
+        if name in self._owned:
+            return True
+        if raw_value is not None:
+            if not self._override:
+                return False
+            self._shadowed[name] = raw_value
+        self._owned.add(name)
+        return True
+
+    def start(self, interval: float) -> None:
+        """Start polling every `interval` seconds in a daemon thread."""
+        import threading
+
+        stop_event = threading.Event()
+
+        def poll() -> None:
+            while not stop_event.wait(interval):
+                self.check()
+
+        thread = threading.Thread(target=poll, name="typenv-watcher", daemon=True)
+        self._poller = stop_event, thread
+        thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the background thread to exit."""
+        if self._poller is not None:
+            stop_event, thread = self._poller
+            stop_event.set()
+            thread.join()
+            self._poller = None
+
+
+def _replace_layer(
+    mapping: Mapping[str, str], old: Mapping[str, str], new: Mapping[str, str]
+) -> Mapping[str, str]:
+    """Return `mapping` with `old` replaced by `new`, also where `old` is
+    a layer of a `ChainMap`, e.g. one created by `Env.read_env_layers`."""
+    if mapping is old:
+        return new
+    if isinstance(mapping, collections.ChainMap):
+        maps = [_replace_layer(m, old, new) for m in mapping.maps]
+        if any(m is not n for m, n in zip(mapping.maps, maps)):
+            return collections.ChainMap(*maps)  # type: ignore[arg-type]
+    return mapping
+
+
+def _invalidate_scan_indexes() -> None:
+    global _scan_generation
+    _scan_generation += 1
+
+
+def _set_or_delete(mapping: MutableMapping[str, str], key: str, value: str | None) -> None:
+    if value is None:
+        mapping.pop(key, None)
+    else:
+        mapping[key] = value
+
+
+class Lazy(Generic[_T]):
+    """A variable that is read, cast and validated on first access.
+
+    Call `get()` to access the value. When assigned as a class
+    attribute, a `Lazy` acts as a descriptor that returns the value.
+    """
+
+    __slots__ = ("_env", "_method", "_name", "_prefix", "_kwds", "_value")
+
+    def __init__(
+        self, env: Env, method: str, name: str, prefix: Iterable[str], kwds: Mapping[str, Any]
+    ):
+        self._env = env
+        self._method = method
+        self._name = name
+        self._prefix = tuple(prefix)
+        self._kwds = kwds
+        self._value: Any = _Missing
+
+    def get(self) -> _T:
+        if self._value is _Missing:
+            env = self._env
+            with env._prefix_as(self._prefix):
+                self._value = getattr(env, self._method)(self._name, **self._kwds)
+        return self._value
+
+    def __get__(self, instance: object, owner: type | None = None) -> _T:
+        return self.get()
+
+
+def _make_typecast_method(cast_type: str) -> Callable:
+    def typecast_method(
+        self: Env,
+        name: str,
+        *,
+        default: Any = _Missing,
+        validate: Callable | Iterable[Callable] = (),
+        from_file: bool = False,
+    ) -> Any:
+        return self._get_and_cast(name, cast_type, default, validate, from_file=from_file)
+
+    typecast_method.__name__ = typecast_method.__qualname__ = cast_type
+    return typecast_method
+
+
+def _make_lazy_typecast_method(cast_type: str) -> Callable:
+    def lazy_typecast_method(self: _LazyEnv, name: str, **kwds: Any) -> Lazy:
+        return self._declare(cast_type, name, kwds)
+
+    lazy_typecast_method.__name__ = lazy_typecast_method.__qualname__ = cast_type
+    return lazy_typecast_method
+
+
+class _LazyEnv:
+    def __init__(self, env: Env):
+        self._env = env
+
+    def _declare(self, method: _Str, name: _Str, kwds: Mapping[_Str, Any]) -> Lazy:
+        env = self._env
+        # Validate the name now so that typos surface at declaration
+        env._preprocess_name(name)
+        lazy_var: Lazy = Lazy(env, method, name, env.prefix, kwds)
+        env._lazy_vars.append(lazy_var)
+        return lazy_var
+
+    @typing.overload
+    def str(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Str | None]: ...
+
+    @typing.overload
+    def str(
+        self, name: _Str, *, default: type[_Missing] | _Str = _Missing, **kwds: Any
+    ) -> Lazy[_Str]: ...
+
+    def str(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("str", name, kwds)
+
+    @typing.overload
+    def bytes(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Bytes | None]: ...
+
+    @typing.overload
+    def bytes(
+        self, name: _Str, *, default: type[_Missing] | _Bytes = _Missing, **kwds: Any
+    ) -> Lazy[_Bytes]: ...
+
+    def bytes(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("bytes", name, kwds)
+
+    @typing.overload
+    def int(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Int | None]: ...
+
+    @typing.overload
+    def int(
+        self, name: _Str, *, default: type[_Missing] | _Int = _Missing, **kwds: Any
+    ) -> Lazy[_Int]: ...
+
+    def int(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("int", name, kwds)
+
+    @typing.overload
+    def bool(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Bool | None]: ...
+
+    @typing.overload
+    def bool(
+        self, name: _Str, *, default: type[_Missing] | _Bool = _Missing, **kwds: Any
+    ) -> Lazy[_Bool]: ...
+
+    def bool(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("bool", name, kwds)
+
+    @typing.overload
+    def float(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Float | None]: ...
+
+    @typing.overload
+    def float(
+        self, name: _Str, *, default: type[_Missing] | _Float = _Missing, **kwds: Any
+    ) -> Lazy[_Float]: ...
+
+    def float(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("float", name, kwds)
+
+    @typing.overload
+    def decimal(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[D | None]: ...
+
+    @typing.overload
+    def decimal(
+        self, name: _Str, *, default: type[_Missing] | D = _Missing, **kwds: Any
+    ) -> Lazy[D]: ...
+
+    def decimal(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("decimal", name, kwds)
+
+    def json(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("json", name, kwds)
+
+    @typing.overload
+    def list(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_List | None]: ...
+
+    @typing.overload
+    def list(
+        self, name: _Str, *, default: type[_Missing] | _List = _Missing, **kwds: Any
+    ) -> Lazy[_List]: ...
+
+    def list(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("list", name, kwds)
+
+    @typing.overload
+    def array(self, name: _Str, *, default: None, **kwds: Any) -> Lazy[_Array | None]: ...
+
+    @typing.overload
+    def array(
+        self, name: _Str, *, default: type[_Missing] | _Array = _Missing, **kwds: Any
+    ) -> Lazy[_Array]: ...
+
+    def array(self, name: _Str, **kwds: Any) -> Lazy[Any]:
+        return self._declare("array", name, kwds)
@@ -0,0 +1,203 @@
+"""A streaming parser for .env files.
+
+The supported syntax and interpolation rules are those of python-dotenv.
+Lines are parsed one at a time. Only a quoted value that spans multiple
+lines is buffered.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+import os
+import re
+
+_BINDING_START = re.compile(
+    r"""
+    \s*
+    # Emulate an atomic group so that "export" is never backtracked into a key
+    (?=((?:export[^\S\n]+)?))\1
+    (?:'(?P<quoted_key>[^']+)'|(?!')(?P<key>[^=\#\s]+))
+    [^\S\n]*
+    (?P<equal_sign>=[^\S\n]*)?
+    """,
+    re.VERBOSE,
+)
+_QUOTED_VALUE = {
+    "'": re.compile(r"'((?:\\.|[^'\\])*)'", re.DOTALL),
+    '"': re.compile(r'"((?:\\.|[^"\\])*)"', re.DOTALL),
+}
+_LINE_END = re.compile(r"(?:[^\S\n]*#[^\n]*)?[^\S\n]*\n?$")
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+_ESCAPES = {
+    "'": re.compile(r"\\[\\']"),
+    '"': re.compile(r"\\[\\'\"abfnrtv]"),
+}
+_ESCAPE_CHARS = {
+    "\\": "\\",
+    "'": "'",
+    '"': '"',
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+_VARIABLE = re.compile(r"\$\{(?P<name>[^\}:]*)(?::-(?P<default>[^\}]*))?\}")
+
+
+class _Incomplete(Exception):
+    """Raised when a quoted value continues on the next line."""
+
+    def __init__(self, quote: str):
+        super().__init__(quote)
+        self.quote = quote
+
+
+def _unescape(quote: str, value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPES[quote].sub(lambda m: _ESCAPE_CHARS[m.group(0)[1]], value)
+
+
+def _parse_binding(chunk: str) -> tuple[str, str | None] | None:
+    """Parse a binding from one or more lines.
+
+    Return None for a comment or an invalid binding. Raise
+    `_Incomplete` if a quoted value is not closed in `chunk`.
+    """
+    match = _BINDING_START.match(chunk)
+    if match is None:
+        return None
+    key = match["quoted_key"] or match["key"]
+    pos = match.end()
+    if match["equal_sign"] is None:
+        value = None
+    elif len(match["equal_sign"]) > 1 and chunk.startswith("#", pos):
+        # `KEY= # comment` has an empty value
+        value = ""
+    elif chunk.startswith(("'", '"'), pos):
+        quote = chunk[pos]
+        quoted_match = _QUOTED_VALUE[quote].match(chunk, pos)
+        if quoted_match is None:
+            raise _Incomplete(quote)
+        value = _unescape(quote, quoted_match.group(1))
+        pos = quoted_match.end()
+    else:
+        end = chunk.find("\n", pos)
+        if end == -1:
+            end = len(chunk)
+        value = _INLINE_COMMENT.sub("", chunk[pos:end]).rstrip()
+        pos = end
+    if not _LINE_END.match(chunk, pos):
+        return None
+    return key, value
+
+
+def _parse_multiline(
+    line: str, line_iter: Iterator[str], pending: list[str]
+) -> tuple[str, str | None] | None:
+    """Parse a binding starting at `line`, reading more lines from
+    `line_iter` while a quoted value is not closed.
+
+    If the quote is never closed, the lines read past `line` are put
+    back to `pending`.
+    """
+    chunk = line
+    continuation: list[str] = []
+    while True:
+        try:
+            return _parse_binding(chunk)
+        except _Incomplete as e:
+            quote = e.quote
+        # Only reparse once a line that may close the quote is found
+        for next_line in line_iter:
+            continuation.append(next_line)
+            if quote in next_line:
+                break
+        else:
+            # The first line is invalid. Lines after it are parsed as usual.
+            pending.extend(reversed(continuation))
+            return None
+        chunk = "".join((line, *continuation))
+
+
+def parse(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """Yield `(key, value)` pairs from lines of a .env file.
+
+    The value is None if the key is not followed by `=`.
+    """
+    line_iter = iter(lines)
+    pending: list[str] = []
+    first = True
+    while True:
+        if pending:
+            line = pending.pop()
+        else:
+            next_line = next(line_iter, None)
+            if next_line is None:
+                return
+            line = next_line
+            if first:
+                line = line.removeprefix("\ufeff")
+                first = False
+        if not line or line.isspace():
+            continue
+        binding = _parse_multiline(line, line_iter, pending)
+        if binding is not None:
+            yield binding
+
+
+def resolve(
+    bindings: Iterable[tuple[str, str | None]],
+    environ: Mapping[str, str],
+    *,
+    override: bool,
+) -> dict[str, str | None]:
+    """Expand `${NAME}` and `${NAME:-default}` in values.
+
+    Names are looked up in previously resolved values and in `environ`.
+    `override` decides which of the two takes precedence.
+    """
+    values: dict[str, str | None] = {}
+
+    def lookup(match: re.Match) -> str:
+        name = match["name"]
+        lookup_order = (values, environ) if override else (environ, values)
+        for mapping in lookup_order:
+            if name in mapping:
+                return mapping[name] or ""
+        return match["default"] or ""
+
+    for key, value in bindings:
+        if value is not None and "${" in value:
+            value = _VARIABLE.sub(lookup, value)
+        values[key] = value
+    return values
+
+
+def find(filename: str) -> str:
+    """Walk up from current working directory looking for `filename`.
+
+    Return the path of the file, or an empty string if not found.
+    """
+    current_dir = os.getcwd()
+    while True:
+        path = os.path.join(current_dir, filename)
+        if os.path.isfile(path):
+            return path
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            return ""
+        current_dir = parent_dir
+
+
+def load(path: str, target: MutableMapping[str, str], *, override: bool) -> None:
+    """Parse a .env file and set its variables in `target`."""
+    with open(path, encoding="utf-8") as f:
+        values = resolve(parse(f), target, override=override)
+    for key, value in values.items():
+        if value is None or (not override and key in target):
+            continue
+        target[key] = value
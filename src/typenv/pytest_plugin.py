@@ -0,0 +1,25 @@
+"""A pytest plugin with fixtures for overriding environment variables.
+
+Enable with `-p typenv.pytest_plugin`, or with
+`pytest_plugins = ["typenv.pytest_plugin"]` in a `conftest.py`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+
+from typenv import Env
+
+
+@pytest.fixture
+def env_overlay() -> Generator[dict[str, str], None, None]:
+    """A dict of values that `Env` instances reading the process
+    environment see in place of environment variables during the test.
+
+    The process environment is not modified.
+    """
+    values: dict[str, str] = {}
+    with Env.overlay(values):
+        yield values
@@ -0,0 +1,138 @@
+from array import array
+import dataclasses
+from decimal import Decimal as D
+from typing import Annotated, Dict, List, Optional, TypedDict, Union
+
+import pytest
+
+import typenv
+from typenv import Env, ParsedValue, Var
+
+
+@dataclasses.dataclass
+class Settings:
+    name: str
+    port: int
+    debug: bool
+    ratio: float
+    price: D
+    hosts: List[str]
+    weights: list[float]
+    shards: array
+    routes: dict
+    nested: List[Dict[str, int]]
+    token: Annotated[bytes, Var("bytes", encoding="hex")]
+    timeout: Annotated[int, "seconds"] = 30
+    retries: Annotated[int, Var("int", validate=lambda v: v >= 0)] = 3
+    user: Optional[str] = None
+    group: Union[str, None] = "staff"
+    tags: list = dataclasses.field(default_factory=list)
+    computed: int = dataclasses.field(default=0, init=False)
+
+
+SOURCE = {
+    "NAME": "app",
+    "PORT": "80",
+    "DEBUG": "true",
+    "RATIO": "0.5",
+    "PRICE": "1.10",
+    "HOSTS": "a,b",
+    "WEIGHTS": "1.5,2",
+    "SHARDS": "0-2",
+    "ROUTES": '{"/": "index"}',
+    "NESTED": '[{"a": 1}]',
+    "TOKEN": "beef",
+    "COMPUTED": "1",
+}
+
+
+def test_bind_dataclass():
+    env = Env(source=SOURCE)
+    settings = env.bind(Settings)
+    assert settings == Settings(
+        name="app",
+        port=80,
+        debug=True,
+        ratio=0.5,
+        price=D("1.10"),
+        hosts=["a", "b"],
+        weights=[1.5, 2.0],
+        shards=array("q", [0, 1, 2]),
+        routes={"/": "index"},
+        nested=[{"a": 1}],
+        token=b"\xbe\xef",
+    )
+    assert env.dump()["USER"] == ParsedValue(None, "str", True)
+    assert env.dump()["RETRIES"] == ParsedValue(3, "int", True)
+    assert "COMPUTED" not in env.dump()
+
+    other = env.bind(Settings)
+    assert other == settings
+    assert other.tags is not settings.tags
+
+
+def test_bind_cached(mocker):
+    env = Env(source=SOURCE)
+    make_loader = mocker.spy(env, "_make_loader")
+    env.bind(Settings)
+    env.bind(Settings)
+    assert make_loader.call_count == 1
+    with env.prefixed("APP_"):
+        with pytest.raises(Exception, match='"APP_NAME" is missing'):
+            env.bind(Settings)
+    assert make_loader.call_count == 2
+
+
+def test_bind_validation():
+    env = Env(source={**SOURCE, "RETRIES": "-1"})
+    with pytest.raises(Exception, match='Invalid value for "RETRIES"'):
+        env.bind(Settings)
+
+
+class Database(TypedDict, total=False):
+    url: str
+    pool_size: int
+
+
+class Service(Database, total=True):
+    name: str
+
+
+def test_bind_typed_dict():
+    env = Env(source={"NAME": "svc", "POOL_SIZE": "5"})
+    assert env.bind(Service) == {"name": "svc", "pool_size": 5}
+    assert env.bind(Database) == {"pool_size": 5}
+
+
+@pytest.mark.parametrize(
+    "hint", [bytes, Union[int, str], Optional[Union[int, str]], List[bytes], Dict[str, str]]
+)
+def test_bind_unsupported_hint(hint):
+    if hint is Dict[str, str]:
+        assert typenv._var_from_hint(hint).type == "json"
+        return
+    with pytest.raises(TypeError, match="Unsupported type hint"):
+        typenv._var_from_hint(hint)
+
+
+def test_bind_not_a_dataclass():
+    class NotBindable:
+        a: int
+
+    with pytest.raises(TypeError, match="Expected a dataclass or a TypedDict"):
+        Env().bind(NotBindable)
+
+
+class Secrets(TypedDict, total=False):
+    key: Annotated[str, Var("str", from_file=True)]
+    token: Annotated[str, Var("str", from_file=True)]
+
+
+def test_bind_from_file(tmp_path):
+    path = tmp_path / "key"
+    path.write_text("deadbeef\n")
+    env = Env(source={"KEY_FILE": str(path), "KEY": "00"})
+    assert env.bind(Secrets) == {"key": "deadbeef"}
+    assert env.bind(Secrets) == {"key": "deadbeef"}
+    env = Env(source={"KEY": "00", "TOKEN": "abc"})
+    assert env.bind(Secrets) == {"key": "00", "token": "abc"}
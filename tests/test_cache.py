@@ -0,0 +1,163 @@
+import os
+
+import pytest
+
+import typenv
+from typenv import Env, ParsedValue, Var
+
+SPEC = {
+    "AN_INT": Var("int", validate=lambda v: v > 0),
+    "A_LIST": Var("list", subcast=int),
+    "MISSING_STR": Var("str", default="x"),
+}
+
+
+@pytest.fixture
+def source():
+    return {"AN_INT": "3", "A_LIST": "1,2"}
+
+
+def test_cache_hit(tmp_path, source, mocker):
+    assert Env(source=source, cache_dir=tmp_path).load(SPEC) == {
+        "AN_INT": 3,
+        "A_LIST": [1, 2],
+        "MISSING_STR": "x",
+    }
+    assert len(os.listdir(tmp_path)) == 1
+
+    load = mocker.spy(Env, "_load")
+    env = Env(source=source, cache_dir=tmp_path)
+    assert env.load(SPEC) == {"AN_INT": 3, "A_LIST": [1, 2], "MISSING_STR": "x"}
+    assert env.dump() == {
+        "AN_INT": ParsedValue(3, "int", False),
+        "A_LIST": ParsedValue([1, 2], "list", False),
+        "MISSING_STR": ParsedValue("x", "str", True),
+    }
+    load.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "changed_source",
+    [
+        {"AN_INT": "4", "A_LIST": "1,2"},
+        {"AN_INT": "3", "A_LIST": "1,2", "MISSING_STR": "y"},
+    ],
+)
+def test_cache_invalidated_by_value(tmp_path, source, changed_source):
+    Env(source=source, cache_dir=tmp_path).load(SPEC)
+    values = Env(source=changed_source, cache_dir=tmp_path).load(SPEC)
+    assert values["AN_INT"] == int(changed_source["AN_INT"])
+    assert values["MISSING_STR"] == changed_source.get("MISSING_STR", "x")
+    # The entry is replaced, not added
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_cache_invalidated_by_spec(tmp_path, source):
+    Env(source=source, cache_dir=tmp_path).load(SPEC)
+    with pytest.raises(Exception) as exc_info:
+        Env(source=source, cache_dir=tmp_path).load(
+            {**SPEC, "AN_INT": Var("int", validate=lambda v: v > 3)}
+        )
+    assert str(exc_info.value) == 'Invalid value for "AN_INT": Value did not pass custom validator'
+    assert Env(source=source, cache_dir=tmp_path).load({**SPEC, "A_LIST": "list"})["A_LIST"] == [
+        "1",
+        "2",
+    ]
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_invalidated_by_version(tmp_path, source, monkeypatch):
+    Env(source=source, cache_dir=tmp_path).load(SPEC)
+    monkeypatch.setattr(typenv, "__version__", "99.0.0")
+    Env(source=source, cache_dir=tmp_path).load(SPEC)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_corrupt_file(tmp_path, source):
+    env = Env(source=source, cache_dir=tmp_path)
+    env.load(SPEC)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"garbage")
+    assert env.load(SPEC)["AN_INT"] == 3
+    assert path.read_bytes() != b"garbage"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX only")
+@pytest.mark.parametrize("mode, other_owner", [(0o666, False), (0o620, False), (0o600, True)])
+def test_cache_file_not_private(tmp_path, source, mocker, mode, other_owner):
+    Env(source=source, cache_dir=tmp_path).load(SPEC)
+    (path,) = tmp_path.iterdir()
+    path.chmod(mode)
+    if other_owner:
+        mocker.patch("os.getuid", return_value=os.getuid() + 1)
+    load = mocker.spy(Env, "_load")
+    assert Env(source=source, cache_dir=tmp_path).load(SPEC)["AN_INT"] == 3
+    load.assert_called_once()
+
+
+def test_cache_unpicklable_default(tmp_path, source):
+    spec = {"MISSING_STR": Var("str", default=lambda: None)}
+    assert Env(source=source, cache_dir=tmp_path).load(spec)["MISSING_STR"]() is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_dir_not_writable(tmp_path, source):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    assert Env(source=source, cache_dir=not_a_dir).load(SPEC)["AN_INT"] == 3
+
+
+def test_cache_replace_fails(tmp_path, source, mocker):
+    mocker.patch("os.replace", side_effect=OSError)
+    assert Env(source=source, cache_dir=tmp_path).load(SPEC)["AN_INT"] == 3
+    assert os.listdir(tmp_path) == []
+
+
+def test_callable_key():
+    class Limit:
+        def __init__(self, limit):
+            self.limit = limit
+
+        def __repr__(self):
+            return f"Limit({self.limit})"
+
+        def check(self, v):
+            return v < self.limit
+
+    def make(limit):
+        return lambda v: v < limit
+
+    assert typenv._callable_key(make(1)) == typenv._callable_key(make(1))
+    assert typenv._callable_key(make(1)) != typenv._callable_key(make(2))
+    assert typenv._callable_key(Limit(1).check) != typenv._callable_key(Limit(2).check)
+    assert typenv._callable_key(int) == typenv._callable_key(int)
+
+
+def is_positive(v):
+    return v > 0
+
+
+def is_large(v):
+    return v > 100
+
+
+def test_callable_key_names():
+    assert typenv._callable_key(lambda v: is_positive(v)) != typenv._callable_key(
+        lambda v: is_large(v)
+    )
+    assert typenv._callable_key(lambda v: all(x > 0 for x in v)) == typenv._callable_key(
+        lambda v: all(x > 0 for x in v)
+    )
+    assert typenv._callable_key(lambda v: all(x > 0 for x in v)) != typenv._callable_key(
+        lambda v: all(x > 1 for x in v)
+    )
+
+
+def test_cache_invalidated_by_called_validator(tmp_path, source):
+    Env(source=source, cache_dir=tmp_path).load(
+        {"AN_INT": Var("int", validate=lambda v: is_positive(v))}
+    )
+    with pytest.raises(Exception, match='Invalid value for "AN_INT"'):
+        Env(source=source, cache_dir=tmp_path).load(
+            {"AN_INT": Var("int", validate=lambda v: is_large(v))}
+        )
@@ -0,0 +1,75 @@
+from typenv import Env, ParsedValue
+
+
+def test_child():
+    parent = Env(source={"REGION": "eu", "A_PORT": "1", "B_PORT": "2", "LATE": "x"})
+    assert parent.str("REGION") == "eu"
+    child_a = parent.child("A_")
+    child_b = parent.child("B_")
+    assert child_a.int("PORT") == 1
+    assert child_b.int("PORT") == 2
+    assert child_a.prefix == ["A_"]
+    assert parent.prefix == []
+
+    parent.str("LATE")
+    assert child_a.dump() == {
+        "REGION": ParsedValue("eu", "str", False),
+        "LATE": ParsedValue("x", "str", False),
+        "A_PORT": ParsedValue(1, "int", False),
+    }
+    assert "A_PORT" in child_a.parsed_view()
+    assert "A_PORT" not in parent.dump()
+    assert "A_PORT" not in child_b.dump()
+    assert child_a.get_example() == "A_PORT=int\nLATE=str\nREGION=str\n"
+    assert parent.get_example() == "LATE=str\nREGION=str\n"
+
+
+def test_child_nested():
+    parent = Env(source={"A_B_C": "1", "A_X": "2"}, upper=True)
+    child = parent.child("a_")
+    grandchild = child.child("b_")
+    assert grandchild.int("c") == 1
+    assert child.int("x") == 2
+    assert grandchild.prefix == ["a_", "b_"]
+    assert grandchild.dump() == {
+        "A_X": ParsedValue(2, "int", False),
+        "A_B_C": ParsedValue(1, "int", False),
+    }
+    with parent.prefixed("A_"):
+        assert parent.child("B_").int("C") == 1
+
+
+def test_child_instrumentation():
+    parent = Env(source={"A_X": "1"}, instrument=True)
+    child = parent.child("A_")
+    child.int("X")
+    assert set(child.stats()) == {"A_X"}
+    assert parent.stats() == {}
+
+    events: list = []
+    parent = Env(source={"A_X": "1"})
+    parent.add_hook(events.append)
+    child = parent.child("A_")
+    child.int("X")
+    assert events == []
+    assert child.stats() == {}
+
+
+def test_child_overlay(set_env):
+    set_env({"A_X": "1"})
+    child = Env().child("A_")
+    with Env.overlay({"A_X": "2"}):
+        assert child.int("X") == 2
+    assert child.int("X") == 1
+
+
+def test_child_read_env_layers(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("A_X=1\n")
+    parent = Env(source={})
+    child = parent.child("A_")
+    assert child.read_env_layers([str(path)]) == [str(path)]
+    assert child.int("X") == 1
+    assert child.dump_origins() == {"A_X": str(path)}
+    assert parent.dump_origins() == {}
+    assert parent.str("A_X", default=None) is None
@@ -1,7 +1,9 @@
 from decimal import Decimal as D
+import io
 
 import pytest
 
+import typenv
 from typenv import Env, ParsedValue
 
 
@@ -76,6 +78,32 @@ def test_validators_that_raise(set_env, env: Env):
     assert str(exc_info.value.__cause__) == "Number is not positive"
 
 
+def test_memoize_validators(monkeypatch):
+    calls = []
+
+    def is_positive(val):
+        calls.append(val)
+        return val > 0
+
+    env = Env(source={"AN_INT": "1", "A_BOOL": "true", "A_LIST": "1"}, memoize_validators=True)
+    assert env.int("AN_INT", validate=is_positive) == 1
+    assert env.int("AN_INT", validate=is_positive) == 1
+    assert env.bool("A_BOOL", validate=is_positive) is True
+    # Unhashable values are validated every time
+    assert env.list("A_LIST", validate=bool) == ["1"]
+    assert env.list("A_LIST", validate=bool) == ["1"]
+    assert calls == [1, True]
+
+    with pytest.raises(Exception, match="AN_INT"):
+        env.int("AN_INT", validate=lambda v: v > 1)
+
+    monkeypatch.setattr(typenv, "_VALIDATION_CACHE_SIZE", 0)
+    env = Env(source={"AN_INT": "1"}, memoize_validators=True)
+    env.int("AN_INT", validate=is_positive)
+    env.int("AN_INT", validate=is_positive)
+    assert calls == [1, True, 1, 1]
+
+
 def test_prefix(set_env, env: Env):
     set_env({"PREFIX_STRING": "some string"})
     assert env.str("PREFIX_STRING") == "some string"
@@ -134,3 +162,61 @@ def test_dump_and_get_example(set_env, env: Env):
         "VAR_3=decimal\n"
         "VAR_4=list\n"
     )
+
+
+def test_parsed_view_and_write_example():
+    env = Env(source={"B": "1", "A": "x"})
+    view = env.parsed_view()
+    assert view == {}
+    env.int("B")
+    assert view == {"B": ParsedValue(1, "int", False)}
+    with pytest.raises(TypeError):
+        view["B"] = ParsedValue(2, "int", False)  # type: ignore[index]
+
+    out = io.StringIO()
+    env.write_example(out)
+    assert out.getvalue() == "B=int\n"
+    env.str("A")
+    env.str("C", default=None)
+    env.str("B")
+    assert env.get_example() == "A=str\nB=str\nC=Optional[str]\n"
+    assert env.get_example() == "A=str\nB=str\nC=Optional[str]\n"
+
+
+def test_source():
+    env = Env(source={"A_STRING": "from source"})
+    assert env.str("A_STRING") == "from source"
+    assert env.load({"A_STRING": "str"}) == {"A_STRING": "from source"}
+    with pytest.raises(Exception, match='"PATH" is missing'):
+        env.str("PATH")
+
+
+def test_snapshot(set_env):
+    set_env({"A_STRING": "original"})
+    env = Env(source=Env.snapshot())
+    set_env({"A_STRING": "changed"})
+    assert env.str("A_STRING") == "original"
+
+
+def test_allowed_chars_iterable(set_env):
+    set_env({"ABC": "1"})
+    env = Env(allowed_chars=(c for c in "ABC"))
+    assert env.int("ABC") == 1
+    assert env.int("ABC") == 1
+    with pytest.raises(ValueError, match="invalid character"):
+        env.int("ABCD")
+
+
+def test_name_cache(set_env, monkeypatch):
+    set_env({"PF_NAME": "1", "OTHER_NAME": "2"})
+    env = Env(upper=True)
+    with env.prefixed("pf_"):
+        assert env.int("name") == 1
+    assert env._name_cache == {"pf_name": "PF_NAME"}
+    with pytest.raises(ValueError):
+        env.int("invalid=")
+    assert env._name_cache == {"pf_name": "PF_NAME"}
+
+    monkeypatch.setattr("typenv._NAME_CACHE_SIZE", 1)
+    assert env.int("other_name") == 2
+    assert env._name_cache == {"pf_name": "PF_NAME"}
@@ -0,0 +1,50 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from typenv import Env, ParsedValue
+
+WORKERS = 16
+ROUNDS = 200
+
+
+def test_prefixed_threads(set_env, env: Env):
+    set_env({f"T{i}_SUB_AN_INT": str(i) for i in range(WORKERS)})
+
+    def read(i):
+        for _ in range(ROUNDS):
+            with env.prefixed(f"T{i}_"):
+                with env.prefixed("SUB_"):
+                    assert env.int("AN_INT") == i
+                assert env.prefix == [f"T{i}_"]
+        return i
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        assert sorted(executor.map(read, range(WORKERS))) == list(range(WORKERS))
+    assert env.prefix == []
+    assert env.dump() == {f"T{i}_SUB_AN_INT": ParsedValue(i, "int", False) for i in range(WORKERS)}
+
+
+def test_prefixed_asyncio_tasks(set_env, env: Env):
+    set_env({f"T{i}_AN_INT": str(i) for i in range(WORKERS)})
+
+    async def read(i):
+        for _ in range(ROUNDS // 10):
+            with env.prefixed(f"T{i}_"):
+                await asyncio.sleep(0)
+                assert env.int("AN_INT") == i
+
+    async def main():
+        await asyncio.gather(*(read(i) for i in range(WORKERS)))
+
+    asyncio.run(main())
+    assert env.prefix == []
+
+
+def test_prefix_assignment(set_env, env: Env):
+    set_env({"PF1_STRING": "1", "PF2_STRING": "2"})
+    env.prefix = ["PF1_"]
+    assert env.str("STRING") == "1"
+    with env.prefixed("IGNORED_"):
+        env.prefix = ["PF2_"]
+        assert env.str("STRING") == "2"
+    assert env.prefix == ["PF1_"]
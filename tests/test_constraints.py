@@ -0,0 +1,124 @@
+import io
+import re
+from typing import Any
+
+import pytest
+
+from typenv import Env, Length, Match, NonEmpty, OneOf, Range, Var, _AllOf
+
+CASES = [
+    (Range(1, 10), [1, 5, 10], [0, 11]),
+    (Range(min=1), [1, 10**9], [0]),
+    (Range(max=1.5), [1.5, -3], [1.6, float("nan")]),
+    (Range(0, 1), [0.5], [float("nan"), float("inf")]),
+    (Range(min=0), [float("inf")], [float("nan")]),
+    (Length(2, 3), ["ab", [1, 2, 3]], ["a", "abcd"]),
+    (Length(min=1), ["a"], [""]),
+    (Length(max=1), [""], ["ab"]),
+    (NonEmpty(), ["a", [1]], ["", [], {}]),
+    (OneOf("debug", "info"), ["debug", "info"], ["warning", "DEBUG"]),
+    (Match(r"[a-z]+"), ["abc"], ["abc1", "1abc", ""]),
+    (Match(r"[a-z]+", flags=re.IGNORECASE), ["ABC"], ["AB1"]),
+]
+
+
+@pytest.mark.parametrize("constraint,valid,invalid", CASES, ids=lambda c: repr(c))
+def test_constraint(constraint, valid, invalid):
+    fused = _AllOf([constraint, constraint])
+    for value in valid:
+        assert constraint(value) is True
+        assert fused(value) is True
+    for value in invalid:
+        with pytest.raises(ValueError, match="does not satisfy"):
+            constraint(value)
+        with pytest.raises(ValueError, match="does not satisfy"):
+            fused(value)
+
+
+def test_constraint_repr():
+    assert repr(Range(1, 65535)) == "Range(1, 65535)"
+    assert repr(Range(min=0)) == "Range(min=0)"
+    assert repr(Length(max=255)) == "Length(max=255)"
+    assert repr(NonEmpty()) == "NonEmpty()"
+    assert repr(OneOf("a", 1)) == "OneOf('a', 1)"
+    assert repr(Match("[a-z]+")) == "Match('[a-z]+')"
+    assert repr(Match("a", flags=re.I | re.M)) == "Match('a', flags=re.IGNORECASE|re.MULTILINE)"
+    assert repr(_AllOf([Range(1, 2), NonEmpty()])) == "_AllOf(Range(1, 2), NonEmpty())"
+
+
+def test_invalid_constraint():
+    with pytest.raises(ValueError, match="needs min or max"):
+        Range()
+    with pytest.raises(ValueError, match="min is greater than max"):
+        Length(2, 1)
+    with pytest.raises(ValueError, match="at least one choice"):
+        OneOf()
+    with pytest.raises(re.error):
+        Match("(")
+
+
+def test_constraint_validation():
+    env = Env(source={"PORT": "70000", "LEVEL": "info"})
+    assert env.str("LEVEL", validate=OneOf("debug", "info")) == "info"
+    with pytest.raises(Exception, match='Invalid value for "PORT"') as exc_info:
+        env.int("PORT", validate=Range(1, 65535))
+    assert str(exc_info.value.__cause__) == "70000 does not satisfy Range(1, 65535)"
+
+
+def test_constraint_nan():
+    env = Env(source={"X": "nan"})
+    with pytest.raises(Exception, match='Invalid value for "X"'):
+        env.float("X", validate=Range(0, 1))
+    with pytest.raises(Exception, match='Invalid value for "X"'):
+        env.load({"X": Var("float", validate=Range(0, 1))})
+
+
+def test_compile_fuses_constraints():
+    def is_even(value):
+        return value % 2 == 0
+
+    env = Env(source={"PORT": "8080", "NAME": "app"})
+    schema = env.compile(
+        {
+            "PORT": Var("int", validate=[Range(min=1), Range(max=65535), is_even, Range(1, 9000)]),
+            "NAME": Var("str", validate=NonEmpty()),
+        }
+    )
+    port_validators: Any
+    name_validators: Any
+    port_validators, name_validators = (var.validators for var in schema._vars)
+    assert len(port_validators) == 3
+    assert repr(port_validators[0].__self__) == "_AllOf(Range(min=1), Range(max=65535))"
+    assert port_validators[1] is is_even
+    assert repr(port_validators[2].__self__) == "_AllOf(Range(1, 9000))"
+    assert repr(name_validators[0].__self__) == "_AllOf(NonEmpty())"
+    assert env.load(schema) == {"PORT": 8080, "NAME": "app"}
+
+    env = Env(source={"PORT": "70000"})
+    with pytest.raises(Exception, match='Invalid value for "PORT"') as exc_info:
+        env.load({"PORT": Var("int", validate=[Range(min=1), Range(max=65535)])})
+    assert "does not satisfy Range(max=65535)" in str(exc_info.value.__cause__)
+
+
+def test_get_example_constraints():
+    env = Env(source={"PORT": "80", "LEVEL": "info"})
+    env.int("PORT", validate=[Range(1, 65535), bool])
+    env.load({"LEVEL": Var("str", validate=[NonEmpty(), OneOf("debug", "info")], default="")})
+    env.str("OTHER", default=None)
+    example = (
+        "LEVEL=Optional[str]  # NonEmpty(), OneOf('debug', 'info')\n"
+        "OTHER=Optional[str]\n"
+        "PORT=int  # Range(1, 65535)\n"
+    )
+    assert env.get_example() == example
+    fileobj = io.StringIO()
+    env.child("CHILD_").write_example(fileobj)
+    assert fileobj.getvalue() == example
+
+
+def test_get_example_constraints_cached(tmp_path):
+    spec = {"PORT": Var("int", validate=Range(1, 65535))}
+    for _ in range(2):
+        env = Env(source={"PORT": "80"}, cache_dir=tmp_path)
+        assert env.load(spec) == {"PORT": 80}
+        assert env.get_example() == "PORT=int  # Range(1, 65535)\n"
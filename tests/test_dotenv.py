@@ -0,0 +1,153 @@
+import io
+import os
+
+import pytest
+
+from typenv import Env, _dotenv
+
+# Pairs of .env file content and the values it should resolve to
+CORPUS = [
+    ("A=1\nB=2\n", {"A": "1", "B": "2"}),
+    ("export A=1\n", {"A": "1"}),
+    ("export   A = 1 \n", {"A": "1"}),
+    ("export=5\n", {"export": "5"}),
+    ("export =5\n", {}),
+    ("exportA=1\n", {"exportA": "1"}),
+    ("A\n", {"A": None}),
+    ("A junk\n", {}),
+    ("=v\nB=1\n", {"B": "1"}),
+    ("'quoted key'=v\n", {"quoted key": "v"}),
+    ("'unclosed=v\nB=2\n", {"B": "2"}),
+    ("\n\n   \nA=1", {"A": "1"}),
+    ("\ufeffA=1\n", {"A": "1"}),
+    ("A=1\r\nB=2\r\n", {"A": "1", "B": "2"}),
+    # Comments
+    ("# comment\n  # comment\nA=1\n", {"A": "1"}),
+    ("A=unquoted # comment\n", {"A": "unquoted"}),
+    ("A=unquoted#notcomment\n", {"A": "unquoted#notcomment"}),
+    ("A= # comment\n", {"A": ""}),
+    ("A=#x\n", {"A": "#x"}),
+    ("A='a' # c\n", {"A": "a"}),
+    ('A="a"#c\n', {"A": "a"}),
+    # Values
+    ("A=\nB=\n", {"A": "", "B": ""}),
+    ("A=  spaced value  \n", {"A": "spaced value"}),
+    ("A=x\tB\n", {"A": "x\tB"}),
+    ("K=a\\nb\n", {"K": "a\\nb"}),
+    ("A=1\nA=2\n", {"A": "2"}),
+    # Quoted values
+    ("A='single'\n", {"A": "single"}),
+    ('A="double"\n', {"A": "double"}),
+    ("A= 'q'\n", {"A": "q"}),
+    ('A=  "q" \n', {"A": "q"}),
+    ("A='esc\\'aped\\n'\n", {"A": "esc'aped\\n"}),
+    ('A="esc\\"aped\\n\\t\\\\"\n', {"A": 'esc"aped\n\t\\'}),
+    ('A="a" b\nB=1\n', {"B": "1"}),
+    ('A="multi\nline"\nB=2\n', {"A": "multi\nline", "B": "2"}),
+    ('A="multi\\"\nline"\n', {"A": 'multi"\nline'}),
+    ('A="x\ny"z\nB=1\n', {"B": "1"}),
+    ('A="unclosed\nB=2\n', {"B": "2"}),
+    ('A="unclosed\nB=2\nC="3\n', {}),
+    # Interpolation
+    (
+        "A=1\nB=${A}\nC=${MISSING:-def}\nD='${A}'\nE=\"${B}x\"\nF=${}\n",
+        {"A": "1", "B": "1", "C": "def", "D": "1", "E": "1x", "F": ""},
+    ),
+    ("A\nB=${A:-default}\n", {"A": None, "B": ""}),
+    ("A=1\nA=2\nB=${A}\n", {"A": "2", "B": "2"}),
+]
+
+
+@pytest.mark.parametrize("content,expected", CORPUS)
+def test_corpus(content, expected):
+    stream = io.StringIO(content, newline=None)
+    assert _dotenv.resolve(_dotenv.parse(stream), {}, override=True) == expected
+
+
+@pytest.mark.parametrize("content,expected", CORPUS)
+def test_corpus_python_dotenv_compat(content, expected):
+    dotenv = pytest.importorskip("dotenv")
+    assert dotenv.dotenv_values(stream=io.StringIO(content)) == expected
+
+
+def test_resolve_precedence():
+    bindings = [("A", "file"), ("B", "${A}")]
+    environ = {"A": "env"}
+    assert _dotenv.resolve(bindings, environ, override=False)["B"] == "env"
+    assert _dotenv.resolve(bindings, environ, override=True)["B"] == "file"
+
+
+def test_read_env_target(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("A=file\nB=file\nC\n")
+    target = {"A": "target"}
+    assert Env.read_env(str(path), target=target)
+    assert target == {"A": "target", "B": "file"}
+    assert Env.read_env(str(path), override=True, target=target)
+    assert target == {"A": "file", "B": "file"}
+    assert "B" not in os.environ
+
+
+def test_read_env_walks_up(tmp_path, monkeypatch):
+    (tmp_path / ".env.walk").write_text("A=1\n")
+    subdir = tmp_path / "sub" / "dir"
+    subdir.mkdir(parents=True)
+    monkeypatch.chdir(subdir)
+    target: dict = {}
+    assert Env.read_env(".env.walk", target=target)
+    assert target == {"A": "1"}
+
+
+def test_read_env_layers(tmp_path):
+    (tmp_path / ".env").write_text("A=base\nB=base\nC=base\nURL=http://${HOST}\n")
+    (tmp_path / ".env.prod").write_text("B=prod\nHOST=prod.example.com\nNOVALUE\n")
+    (tmp_path / ".env.local").write_text("C=local\nD=${B}-local\n")
+    paths = [str(tmp_path / name) for name in (".env", ".env.prod", ".env.missing", ".env.local")]
+    source = {"A": "env"}
+    env = Env(source=source)
+    assert env.read_env_layers(paths) == [paths[0], paths[1], paths[3]]
+    assert source == {"A": "env"}
+    assert env.load({"A": "str", "B": "str", "C": "str", "D": "str", "URL": "str"}) == {
+        "A": "env",
+        "B": "prod",
+        "C": "local",
+        "D": "prod-local",
+        "URL": "http://",
+    }
+    assert env.dump_origins() == {
+        "B": paths[1],
+        "C": paths[3],
+        "D": paths[3],
+        "URL": paths[0],
+    }
+
+
+def test_read_env_layers_override(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("A=file\nB=${A}\n")
+    env = Env(source={"A": "env", "C": "env"})
+    assert env.read_env_layers([str(path)], override=True) == [str(path)]
+    assert env.load({"A": "str", "B": "str", "C": "str"}) == {"A": "file", "B": "file", "C": "env"}
+    assert env.dump_origins() == {"A": str(path), "B": str(path)}
+
+
+@pytest.mark.parametrize("override, expected", [(False, "env"), (True, "file1")])
+def test_read_env_layers_interpolation_precedence(tmp_path, override, expected):
+    (tmp_path / "1.env").write_text("A=file1\n")
+    (tmp_path / "2.env").write_text("B=${A}\n")
+    paths = [str(tmp_path / "1.env"), str(tmp_path / "2.env")]
+    env = Env(source={"A": "env"})
+    env.read_env_layers(paths, override=override)
+    assert env.load({"A": "str", "B": "str"}) == {"A": expected, "B": expected}
+    # Same as reading each file in turn into the source
+    target = {"A": "env"}
+    for path in paths:
+        Env.read_env(path, override=override, target=target)
+    assert target == {"A": expected, "B": expected}
+
+
+def test_read_env_layers_none_found(tmp_path):
+    source = {"A": "env"}
+    env = Env(source=source)
+    assert env.read_env_layers([str(tmp_path / ".env")]) == []
+    assert env._source is source
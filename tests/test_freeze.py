@@ -0,0 +1,31 @@
+import pickle
+
+from typenv import Env, FrozenEnv, ParsedValue
+
+
+def test_freeze(set_env, env: Env):
+    set_env({"AN_INT": "1", "A_JSON": '{"a": [1]}'})
+    env.int("AN_INT")
+    env.json("A_JSON")
+    env.str("MISSING_STRING", default=None)
+    frozen = env.freeze()
+    assert isinstance(frozen, FrozenEnv)
+
+    restored = Env.from_frozen(pickle.loads(pickle.dumps(frozen)), upper=True)
+    assert restored.dump() == env.dump()
+
+    set_env({"AN_INT": "2", "A_JSON": "[]", "MISSING_STRING": "set"})
+    assert restored.int("an_int") == 1
+    assert restored.json("A_JSON") == {"a": [1]}
+    assert restored.str("MISSING_STRING", default=None) is None
+
+
+def test_from_frozen_mismatch(set_env, env: Env):
+    set_env({"AN_INT": "1"})
+    env.int("AN_INT")
+    restored = Env.from_frozen(env.freeze())
+
+    set_env({"AN_INT": "2"})
+    assert restored.str("AN_INT") == "2"
+    assert restored.int("AN_INT", default=0) == 2
+    assert restored.dump() == {"AN_INT": ParsedValue(2, "int", True)}
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from typenv import Env, ParsedValue, Var
+
+
+@pytest.fixture
+def secret_path(tmp_path):
+    path = tmp_path / "db_password"
+    path.write_text("hunter2\n")
+    return str(path)
+
+
+def test_from_file(secret_path):
+    env = Env(source={"DB_PASSWORD_FILE": secret_path, "DB_PASSWORD": "ignored"})
+    assert env.str("DB_PASSWORD", from_file=True) == "hunter2"
+    assert env.dump() == {"DB_PASSWORD": ParsedValue("hunter2", "str", False)}
+    assert env.str("DB_PASSWORD") == "ignored"
+
+
+def test_from_file_fallback():
+    env = Env(source={"DB_PASSWORD": "hunter2"})
+    assert env.str("DB_PASSWORD", from_file=True) == "hunter2"
+    assert env.int("PORT", default=5432, from_file=True) == 5432
+
+
+def test_from_file_cast(tmp_path):
+    path = tmp_path / "ports"
+    path.write_text("1,2\r\n")
+    env = Env(source={"PORTS_FILE": str(path)})
+    assert env.list("PORTS", subcast=int, from_file=True) == [1, 2]
+    assert env.lazy.list("PORTS", subcast=int, from_file=True).get() == [1, 2]
+
+    path = tmp_path / "key"
+    path.write_text("deadbeef\n")
+    env = Env(source={"KEY_FILE": str(path), "KEY": "00"})
+    assert env.bytes("KEY", encoding="hex", from_file=True) == bytes.fromhex("deadbeef")
+
+
+def test_from_file_missing_file(tmp_path):
+    env = Env(source={"DB_PASSWORD_FILE": str(tmp_path / "missing")})
+    with pytest.raises(Exception) as exc_info:
+        env.str("DB_PASSWORD", from_file=True)
+    assert str(exc_info.value) == (
+        f'Failed to read "{tmp_path / "missing"}" (variable name "DB_PASSWORD_FILE")'
+    )
+
+
+def test_load_from_file(secret_path):
+    env = Env(source={"DB_PASSWORD_FILE": secret_path, "DB_USER": "admin"})
+    spec = {
+        "DB_PASSWORD": Var("str", from_file=True),
+        "DB_USER": Var("str", from_file=True),
+        "DB_NAME": Var("str", default="db", from_file=True),
+    }
+    expected = {"DB_PASSWORD": "hunter2", "DB_USER": "admin", "DB_NAME": "db"}
+    assert env.load(spec) == expected
+    assert asyncio.run(env.aload(spec)) == expected
+    assert asyncio.run(env.aload({"DB_USER": "str"})) == {"DB_USER": "admin"}
+
+
+def test_load_from_file_cached(tmp_path, secret_path):
+    source = {"DB_PASSWORD_FILE": secret_path}
+    spec = {"DB_PASSWORD": Var("str", from_file=True)}
+    assert Env(source=source, cache_dir=tmp_path / "cache").load(spec) == {
+        "DB_PASSWORD": "hunter2"
+    }
+    with open(secret_path, "w") as f:
+        f.write("rotated")
+    assert Env(source=source, cache_dir=tmp_path / "cache").load(spec) == {
+        "DB_PASSWORD": "rotated"
+    }
+    assert not (tmp_path / "cache").exists()
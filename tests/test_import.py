@@ -0,0 +1,87 @@
+from collections.abc import Iterable
+import platform
+import subprocess
+import sys
+
+import pytest
+
+# Standard library modules that `typenv` imports eagerly
+EAGER_MODULES = (
+    "__future__",
+    "bisect",
+    "collections",
+    "contextlib",
+    "contextvars",
+    "functools",
+    "importlib",
+    "itertools",
+    "os",
+    "time",
+    "types",
+    "typing",
+    "weakref",
+)
+# Upper limit for the cumulative time of `import typenv`, as a multiple of
+# the time of importing `EAGER_MODULES` alone, measured in the same run so
+# that slow CI machines do not fail. The module body of `typenv` takes less
+# than half of that time. Importing a heavy module, e.g. python-dotenv,
+# exceeds the limit.
+IMPORT_TIME_BUDGET = 2.0
+
+pytestmark = pytest.mark.skipif(
+    platform.python_implementation() != "CPython", reason="-X importtime is CPython only"
+)
+
+
+def _import_typenv(code: str = "") -> subprocess.CompletedProcess:
+    return _run_importtime(f"import typenv\n{code}")
+
+
+def _run_importtime(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(code: str, modules: Iterable[str]) -> int:
+    """Return the minimum of three runs of the cumulative import time of
+    `modules` imported by `code`, in microseconds."""
+    modules = set(modules)
+    times = []
+    for _ in range(3):
+        stderr = _run_importtime(code).stderr
+        # Modules that `code` imports directly are indented by one space
+        times.append(
+            sum(
+                int(line.split("|")[1])
+                for line in stderr.splitlines()
+                if line.split("|")[-1][1:] in modules
+            )
+        )
+    return min(times)
+
+
+def test_lazy_imports():
+    lazy_modules = {
+        "asyncio",
+        "concurrent.futures",
+        "decimal",
+        "dotenv",
+        "hashlib",
+        "json",
+        "pickle",
+        "string",
+        "tempfile",
+        "threading",
+        "typenv._dotenv",
+    }
+    result = _import_typenv(f"import sys\nprint(sorted({lazy_modules!r} & set(sys.modules)))")
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_time_budget():
+    reference = _cumulative_us(f"import {', '.join(EAGER_MODULES)}", EAGER_MODULES)
+    assert _cumulative_us("import typenv", {"typenv"}) < IMPORT_TIME_BUDGET * reference
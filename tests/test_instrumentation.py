@@ -0,0 +1,101 @@
+import pytest
+
+from typenv import Env, ReadEvent, Var, VarStats
+
+
+def test_no_instrumentation():
+    env = Env(source={"AN_INT": "1"})
+    env.int("AN_INT")
+    assert env.stats() == {}
+    assert "_resolve" not in vars(env)
+
+
+def test_hooks():
+    env = Env(source={"AN_INT": "1", "A_STR": "a", "BAD_INT": "x"})
+    events: list[ReadEvent] = []
+    env.add_hook(events.append)
+    env.int("AN_INT", validate=lambda v: v > 0)
+    env.str("MISSING", default="b")
+    env.str("MISSING_NONE", default=None)
+    env.load({"A_STR": "str"})
+    with pytest.raises(Exception, match="Failed to cast"):
+        env.int("BAD_INT")
+    with pytest.raises(Exception, match="Invalid value"):
+        env.int("AN_INT", validate=lambda v: v > 1)
+    with pytest.raises(Exception, match="is missing"):
+        env.int("MISSING")
+
+    assert [(e.name, e.type, e.outcome) for e in events] == [
+        ("AN_INT", "int", "value"),
+        ("MISSING", "str", "default"),
+        ("MISSING_NONE", "str", "default"),
+        ("A_STR", "str", "value"),
+        ("BAD_INT", "int", "error"),
+        ("AN_INT", "int", "error"),
+        ("MISSING", "int", "error"),
+    ]
+    assert all(e.name_ns > 0 and e.lookup_ns > 0 and e.cast_ns > 0 for e in events[:1])
+    assert events[0].validate_ns > 0
+    assert events[3].name_ns == 0
+
+    assert env.stats()["AN_INT"] == VarStats(
+        reads=2, cache_hits=0, defaults=0, errors=1, total_ns=env.stats()["AN_INT"].total_ns
+    )
+    assert env.stats()["MISSING"][:4] == (2, 0, 1, 1)
+
+    env.remove_hook(events.append)
+    assert "_resolve" not in vars(env)
+    assert env.stats() == {}
+    with pytest.raises(ValueError):
+        env.remove_hook(events.append)
+
+
+def test_instrument_stats(tmp_path):
+    env = Env(source={"AN_INT": "1"}, instrument=True)
+    env.int("AN_INT")
+    frozen_env = Env.from_frozen(env.freeze(), instrument=True)
+    frozen_env.int("AN_INT")
+    assert frozen_env.stats()["AN_INT"][:4] == (1, 1, 0, 0)
+
+    env.add_hook(print)
+    env.remove_hook(print)
+    assert env.stats()["AN_INT"].reads == 1
+
+    spec = {"AN_INT": Var("int")}
+    Env(source={"AN_INT": "1"}, cache_dir=tmp_path).load(spec)
+    cached_env = Env(source={"AN_INT": "1"}, cache_dir=tmp_path, instrument=True)
+    cached_env.load(spec)
+    assert cached_env.stats()["AN_INT"][:4] == (1, 1, 0, 0)
+
+
+def test_concurrent_validation_instrumented():
+    env = Env(source={"AN_INT": "1"}, instrument=True)
+    assert env.load({"AN_INT": "int"}, concurrent_validation=True) == {"AN_INT": 1}
+    assert env.stats()["AN_INT"].reads == 1
+
+
+def test_from_file_instrumented(tmp_path):
+    path = tmp_path / "secret"
+    path.write_text("hunter2")
+    env = Env(source={"SECRET_FILE": str(path), "MISSING_FILE": str(tmp_path / "x")})
+    events: list[ReadEvent] = []
+    env.add_hook(events.append)
+    assert env.str("SECRET", from_file=True) == "hunter2"
+    with pytest.raises(Exception, match="Failed to read"):
+        env.str("MISSING", from_file=True)
+    assert [(e.name, e.outcome) for e in events] == [("SECRET", "value"), ("MISSING", "error")]
+    assert events[0].lookup_ns > 0
+    assert env.stats()["SECRET"].reads == 1
+
+
+def test_failing_hook():
+    def hook(event: ReadEvent) -> None:
+        raise RuntimeError("hook")
+
+    env = Env(source={"AN_INT": "1", "BAD_INT": "x"})
+    env.add_hook(hook)
+    with pytest.raises(Exception, match="Failed to cast"):
+        env.int("BAD_INT")
+    with pytest.raises(RuntimeError, match="hook"):
+        env.int("AN_INT")
+    assert env.stats()["BAD_INT"].errors == 1
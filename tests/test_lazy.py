@@ -0,0 +1,76 @@
+from decimal import Decimal as D
+
+import pytest
+
+from typenv import Env, ParsedValue
+
+
+def test_lazy(set_env, env: Env):
+    set_env({"A_JSON": "[1, 2]", "PF_AN_INT": "7"})
+    calls = []
+
+    def validate(value):
+        calls.append(value)
+
+    a_json = env.lazy.json("A_JSON", validate=validate)
+    with env.prefixed("PF_"):
+        an_int = env.lazy.int("AN_INT")
+    assert calls == []
+    assert env.dump() == {}
+
+    assert a_json.get() == [1, 2]
+    assert a_json.get() == [1, 2]
+    assert calls == [[1, 2]]
+    assert an_int.get() == 7
+    assert env.dump() == {
+        "A_JSON": ParsedValue([1, 2], "json", False),
+        "PF_AN_INT": ParsedValue(7, "int", False),
+    }
+
+
+def test_lazy_descriptor(set_env, env: Env):
+    set_env({"A_FLOAT": "0.5", "A_LIST": "a,b"})
+
+    class Settings:
+        A_FLOAT = env.lazy.float("A_FLOAT")
+        A_LIST = env.lazy.list("A_LIST")
+        MISSING_STRING = env.lazy.str("THIS_IS_NOT_IN_ENV", default="default")
+
+    assert Settings.A_FLOAT == 0.5
+    assert Settings().A_LIST == ["a", "b"]
+    assert Settings.MISSING_STRING == "default"
+
+
+def test_lazy_all_types(set_env, env: Env):
+    set_env(
+        {"A_BOOL": "true", "SOME_BYTES": "01", "A_DECIMAL": "1.1", "A_LIST": "1,2", "AN_INT": "1"}
+    )
+    assert env.lazy.bool("A_BOOL").get() is True
+    assert env.lazy.bytes("SOME_BYTES", encoding="hex").get() == b"\x01"
+    assert env.lazy.decimal("A_DECIMAL").get() == D("1.1")
+    assert env.lazy.list("A_LIST", subcast=int).get() == [1, 2]
+    assert env.lazy.array("A_LIST").get().tolist() == [1, 2]
+    assert env.lazy.int("AN_INT", default=None).get() == 1
+
+
+def test_lazy_errors(set_env, env: Env):
+    with pytest.raises(ValueError, match="invalid character"):
+        env.lazy.int("INVALID=")
+
+    an_int = env.lazy.int("AN_INT")
+    set_env({"AN_INT": "not an int"})
+    with pytest.raises(Exception, match="Failed to cast"):
+        an_int.get()
+    set_env({"AN_INT": "1"})
+    assert an_int.get() == 1
+
+
+def test_resolve_all(set_env, env: Env):
+    set_env({"AN_INT": "1"})
+    env.lazy.int("AN_INT")
+    env.resolve_all()
+    assert env.dump() == {"AN_INT": ParsedValue(1, "int", False)}
+
+    env.lazy.int("THIS_IS_NOT_IN_ENV")
+    with pytest.raises(Exception, match='"THIS_IS_NOT_IN_ENV" is missing'):
+        env.resolve_all()
@@ -0,0 +1,89 @@
+from decimal import Decimal as D
+
+import pytest
+
+from typenv import Env, ParsedValue, Range, Var
+
+
+def test_load(set_env, env: Env):
+    set_env({"A_STRING": "blabla", "AN_INT": "3", "A_LIST": "1.5,2"})
+    assert env.load(
+        {
+            "A_STRING": "str",
+            "AN_INT": Var("int", validate=lambda v: v > 0),
+            "A_LIST": Var("list", subcast=D),
+            "MISSING_BOOL": Var("bool", default=False),
+            "MISSING_JSON": Var("json", default=None),
+        }
+    ) == {
+        "A_STRING": "blabla",
+        "AN_INT": 3,
+        "A_LIST": [D("1.5"), D("2")],
+        "MISSING_BOOL": False,
+        "MISSING_JSON": None,
+    }
+    assert env.dump() == {
+        "A_STRING": ParsedValue("blabla", "str", False),
+        "AN_INT": ParsedValue(3, "int", False),
+        "A_LIST": ParsedValue([D("1.5"), D("2")], "list", False),
+        "MISSING_BOOL": ParsedValue(False, "bool", True),
+        "MISSING_JSON": ParsedValue(None, "json", True),
+    }
+
+
+def test_load_compiled_schema(set_env, env: Env):
+    with env.prefixed("PF_"):
+        schema = env.compile({"AN_INT": "int"})
+    assert len(schema) == 1
+    assert schema.names() == ["PF_AN_INT"]
+
+    set_env({"PF_AN_INT": "1"})
+    assert env.load(schema) == {"AN_INT": 1}
+    set_env({"PF_AN_INT": "2"})
+    assert env.load(schema) == {"AN_INT": 2}
+
+
+def test_load_missing(env: Env):
+    with pytest.raises(Exception, match='"THIS_IS_NOT_IN_ENV" is missing'):
+        env.load({"THIS_IS_NOT_IN_ENV": "int"})
+
+
+def test_load_invalid(set_env, env: Env):
+    set_env({"AN_INT": "3"})
+    with pytest.raises(Exception, match="Value did not pass custom validator"):
+        env.load({"AN_INT": Var("int", validate=(lambda v: v > 0, lambda v: v > 5))})
+
+
+def test_compile_errors(env: Env):
+    with pytest.raises(ValueError, match="invalid character"):
+        env.compile({"INVALID=": "int"})
+    with pytest.raises(ValueError, match='Unknown type "integer"'):
+        env.compile({"AN_INT": "integer"})
+    with pytest.raises(TypeError):
+        env.compile({"MISSING_JSON": Var("json", default=object())})
+
+
+def test_load_concurrent_validation():
+    env = Env(source={"A": "1", "B": "2", "C": "3"})
+    spec = {
+        "A": Var("int", validate=lambda v: v > 1),
+        "B": Var("int", validate=lambda v: v > 1),
+        "C": Var("int", validate=Range(4, None)),
+        "D": Var("int", default=None),
+    }
+    with pytest.raises(Exception) as exc_info:
+        env.load(spec, concurrent_validation=True)
+    assert str(exc_info.value) == (
+        'Invalid value for "A": Value did not pass custom validator\n'
+        'Invalid value for "C": Value did not pass custom validator:'
+        " 3 does not satisfy Range(min=4)"
+    )
+    assert env.dump() == {}
+
+    assert env.load({**spec, "A": "int", "C": "int"}, concurrent_validation=True) == {
+        "A": 1,
+        "B": 2,
+        "C": 3,
+        "D": None,
+    }
+    assert env.dump()["B"] == ParsedValue(2, "int", False)
@@ -0,0 +1,49 @@
+import os
+
+from typenv import Env
+
+pytest_plugins = ["typenv.pytest_plugin"]
+
+
+def test_overlay(set_env):
+    set_env({"AN_INT": "1", "A_STR": "env"})
+    env = Env()
+    source_env = Env(source={"AN_INT": "3"})
+    with Env.overlay({"AN_INT": "2"}):
+        created_inside = Env()
+        assert env.int("AN_INT") == 2
+        assert created_inside.int("AN_INT") == 2
+        assert env.str("A_STR") == "env"
+        assert source_env.int("AN_INT") == 3
+        assert os.environ["AN_INT"] == "1"
+        with Env.overlay({"A_STR": "nested"}):
+            assert env.int("AN_INT") == 2
+            assert env.str("A_STR") == "nested"
+        assert env.str("A_STR") == "env"
+    assert env.int("AN_INT") == 1
+    assert created_inside.int("AN_INT") == 1
+
+
+def test_env_overlay_fixture(env_overlay):
+    env = Env()
+    env_overlay["THIS_IS_NOT_IN_ENV"] = "1"
+    assert env.int("THIS_IS_NOT_IN_ENV") == 1
+    assert "THIS_IS_NOT_IN_ENV" not in os.environ
+
+
+def test_overlay_read_env_layers(set_env, tmp_path, env_overlay):
+    set_env({"AN_INT": "1"})
+    path = tmp_path / ".env"
+    path.write_text("A_STR=file\nAN_INT=3\n")
+    env = Env()
+    env.read_env_layers([str(path)])
+    child = env.child("A_")
+    env_overlay["AN_INT"] = "2"
+    assert env.int("AN_INT") == 2
+    with Env.overlay({"A_STR": "overlay"}):
+        env.read_env_layers([str(path)])
+        assert env.str("A_STR") == "overlay"
+        assert child.str("STR") == "overlay"
+    assert env.str("A_STR") == "file"
+    assert child.str("STR") == "file"
+    assert env.int("AN_INT") == 2
@@ -0,0 +1,135 @@
+import dataclasses
+from datetime import timedelta
+from decimal import Decimal as D
+
+import pytest
+
+import typenv
+from typenv import Env, ParsedValue, Var
+
+
+def parse_duration(value: str) -> timedelta:
+    return timedelta(seconds=int(value.removesuffix("s")))
+
+
+class Mutable(list):
+    pass
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Undo `Env.register_type` of "duration" after the test."""
+    for registry in (
+        "_typecast_map",
+        "_subcast_map",
+        "_HINT_TYPES",
+        "_SUBCAST_TYPES",
+        "_IMMUTABLE_CASTS",
+        "_IMMUTABLE_SUBCASTS",
+    ):
+        monkeypatch.setattr(typenv, registry, getattr(typenv, registry).copy())
+    monkeypatch.setattr(typenv, "_cached_casters", typenv._CachedCasters())
+    yield
+    for type_name in ("duration", "mutable"):
+        for cls in (Env, typenv._LazyEnv):
+            if type_name in vars(cls):
+                delattr(cls, type_name)
+
+
+def test_register_type(registry):
+    Env.register_type("duration", parse_duration, python_type=timedelta)
+    env = Env(source={"TIMEOUT": "30s", "TIMEOUTS": "1s,2s", "RETRY_AFTER": "5s"})
+    assert env.duration("TIMEOUT") == timedelta(seconds=30)  # type: ignore[attr-defined]
+    assert env.duration("MISSING", default=None) is None  # type: ignore[attr-defined]
+    lazy_timeout = env.lazy.duration("TIMEOUT")  # type: ignore[attr-defined]
+    assert lazy_timeout.get() == timedelta(seconds=30)
+    assert env.list("TIMEOUTS", subcast=timedelta) == [timedelta(seconds=1), timedelta(seconds=2)]
+    assert env.load({"TIMEOUT": Var("duration")}) == {"TIMEOUT": timedelta(seconds=30)}
+    assert env.scan("RETRY_", "duration") == {"AFTER": timedelta(seconds=5)}
+    assert env.dump()["TIMEOUT"] == ParsedValue(timedelta(seconds=30), "duration", False)
+
+    @dataclasses.dataclass
+    class Settings:
+        timeout: timedelta
+        timeouts: list[timedelta]
+
+    assert env.bind(Settings) == Settings(
+        timedelta(seconds=30), [timedelta(seconds=1), timedelta(seconds=2)]
+    )
+
+
+@pytest.mark.parametrize("name", ["str", "dump", "_private", "not-an-identifier"])
+def test_register_type_invalid_name(registry, name):
+    with pytest.raises(ValueError):
+        Env.register_type(name, str)
+
+
+@pytest.mark.parametrize("python_type", [int, D, timedelta])
+def test_register_type_existing_python_type(registry, python_type):
+    Env.register_type("duration", parse_duration, python_type=timedelta)
+    with pytest.raises(ValueError, match="already has a type"):
+        Env.register_type("mutable", str, python_type=python_type)
+    assert not hasattr(Env, "mutable")
+    assert Env(source={"PORTS": "1,2"}).list("PORTS", subcast=int) == [1, 2]
+
+
+def test_register_type_cache_dir(registry, tmp_path):
+    source = {"T": "30"}
+    Env.register_type("duration", int)
+    assert Env(source=source, cache_dir=tmp_path).load({"T": "duration"}) == {"T": 30}
+    # As if registered with another caster in a later process
+    typenv._typecast_map["duration"] = lambda value: int(value) * 60
+    assert Env(source=source, cache_dir=tmp_path).load({"T": "duration"}) == {"T": 1800}
+
+
+def test_register_type_without_python_type(registry):
+    Env.register_type("duration", parse_duration)
+    with pytest.raises(ValueError, match="Unsupported subcast"):
+        Env(source={"TIMEOUTS": "1s"}).list("TIMEOUTS", subcast=timedelta)
+
+
+def test_cast_cache(mocker):
+    source = {"A_JSON": '{"a": 1}', "A_DECIMAL": "1.5", "A_LIST": "1,2", "AN_ARRAY": "1,2"}
+    first = Env(source=source, cast_cache=True)
+    second = Env(source=source, cast_cache=True)
+    assert first.decimal("A_DECIMAL") is second.decimal("A_DECIMAL")
+    assert Env(source=source).decimal("A_DECIMAL") == D("1.5")
+
+    # Mutable results are copied
+    first_list = first.list("A_LIST", subcast=int)
+    assert first_list == [1, 2]
+    first_list.clear()
+    assert second.list("A_LIST", subcast=int) == [1, 2]
+    assert first.list("A_LIST") == ["1", "2"]
+    first_array = first.array("AN_ARRAY")
+    first_array[0] = 0
+    assert list(second.array("AN_ARRAY")) == [1, 2]
+
+    # Results that would need a deep copy are not cached
+    loads = mocker.Mock(side_effect=lambda value: {"a": 1})
+    first = Env(source=source, json_loads=loads, cast_cache=True)
+    first.json("A_JSON")["a"] = 2
+    assert first.json("A_JSON") == {"a": 1}
+    assert loads.call_count == 2
+
+
+def test_cast_cache_mutable_bytes():
+    env = Env(source={"KEY": "beef"}, cast_cache=True)
+    key = env.bytes("KEY", encoding="hex", mutable=True)
+    # Raises if `key` is immutable
+    memoryview(key)[:] = bytes(len(key))
+    assert env.bytes("KEY", encoding="hex", mutable=True) == bytearray(b"\xbe\xef")
+    assert env.bytes("KEY", encoding="hex") is env.bytes("KEY", encoding="hex")
+
+
+def test_cast_cache_registered_type(registry, mocker):
+    mutable_caster = mocker.Mock(side_effect=lambda value: [value])
+    Env.register_type("duration", parse_duration, python_type=timedelta, immutable=True)
+    Env.register_type("mutable", mutable_caster, python_type=Mutable)
+    env = Env(source={"TIMEOUT": "1s", "TIMEOUTS": "1s,2s", "A": "a"}, cast_cache=True)
+    assert env.duration("TIMEOUT") is env.duration("TIMEOUT")  # type: ignore[attr-defined]
+    assert env.list("TIMEOUTS", subcast=timedelta) == [timedelta(seconds=1), timedelta(seconds=2)]
+    assert env.mutable("A") is not env.mutable("A")  # type: ignore[attr-defined]
+    assert env.list("A", subcast=Mutable) == [["a"]]
+    assert env.list("A", subcast=Mutable) == [["a"]]
+    assert mutable_caster.call_count == 4
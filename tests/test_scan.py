@@ -0,0 +1,65 @@
+import pytest
+
+from typenv import Env, ParsedValue
+
+
+def test_scan():
+    source = {
+        "TENANT_ACME_": "0",
+        "TENANT_ACME_A": "1",
+        "TENANT_ACME_B": "2",
+        "TENANT_ACME_lower": "3",
+        "TENANT_ACMEX": "4",
+        "TENANT_OTHER_A": "5",
+    }
+    env = Env(source=source)
+    assert env.scan("TENANT_ACME_", "int") == {"A": 1, "B": 2}
+    assert env.dump() == {
+        "TENANT_ACME_A": ParsedValue(1, "int", False),
+        "TENANT_ACME_B": ParsedValue(2, "int", False),
+    }
+    with env.prefixed("TENANT_"):
+        assert env.scan("OTHER_") == {"A": "5"}
+    assert env.scan("NO_MATCH_") == {}
+
+
+def test_scan_kwds_and_validate():
+    env = Env(source={"LIST_A": "1,2", "LIST_B": "3"}, upper=True)
+    assert env.scan("list_", "list", subcast=int) == {"A": [1, 2], "B": [3]}
+    with pytest.raises(Exception, match="LIST_B"):
+        env.scan("list_", "list", subcast=int, validate=lambda v: len(v) == 2)
+
+
+def test_scan_index_refresh(set_env, env: Env):
+    set_env({"SCAN_TEST_A": "1"})
+    assert env.scan("SCAN_TEST_") == {"A": "1"}
+    set_env({"SCAN_TEST_B": "2"})
+    assert env.scan("SCAN_TEST_") == {"A": "1"}
+    assert env.scan("SCAN_TEST_", refresh=True) == {"A": "1", "B": "2"}
+
+
+def test_scan_replaced_variable():
+    source = {"A_1": "1", "A_2": "2"}
+    env = Env(source=source)
+    assert env.scan("A_") == {"1": "1", "2": "2"}
+    del source["A_2"]
+    source["A_3"] = "3"
+    assert env.scan("A_") == {"1": "1"}
+    assert env.scan("A_", refresh=True) == {"1": "1", "3": "3"}
+
+
+def test_scan_index_invalidated(tmp_path):
+    source = {"A_1": "1"}
+    env = Env(source=source)
+    assert env.scan("A_") == {"1": "1"}
+    path = tmp_path / ".env"
+    path.write_text("A_2=2\n")
+    Env.read_env(str(path), target=source)
+    assert env.scan("A_") == {"1": "1", "2": "2"}
+
+
+def test_scan_index_overlay(env: Env):
+    assert env.scan("SCAN_OVERLAY_") == {}
+    with Env.overlay({"SCAN_OVERLAY_A": "1"}):
+        assert env.scan("SCAN_OVERLAY_") == {"A": "1"}
+    assert env.scan("SCAN_OVERLAY_") == {}
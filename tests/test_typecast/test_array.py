@@ -0,0 +1,32 @@
+from array import array
+
+import pytest
+
+
+def test_array(set_env, env):
+    set_env({"INT_ARRAY": "1,-2,3", "FLOAT_ARRAY": "0.5;-1e3", "EMPTY_ARRAY": ""})
+    assert env.array("INT_ARRAY") == array("q", [1, -2, 3])
+    assert env.array("INT_ARRAY", typecode="b") == array("b", [1, -2, 3])
+    assert env.array("FLOAT_ARRAY", typecode="d", sep=";") == array("d", [0.5, -1000.0])
+    assert env.array("EMPTY_ARRAY") == array("q")
+
+
+def test_array_ranges(set_env, env):
+    set_env({"RANGE_ARRAY": "1-3,7,-2--1,10-10"})
+    assert env.array("RANGE_ARRAY") == array("q", [1, 2, 3, 7, -2, -1, 10])
+
+
+def test_array_invalid(set_env, env):
+    set_env({"BAD_RANGE": "3-1", "OVERFLOW": "1000", "NOT_A_NUMBER": "1,x"})
+    with pytest.raises(Exception, match="Failed to cast") as exc_info:
+        env.array("BAD_RANGE")
+    assert str(exc_info.value.__cause__) == 'Invalid range "3-1"'
+    with pytest.raises(Exception, match="Failed to cast"):
+        env.array("OVERFLOW", typecode="b")
+    with pytest.raises(Exception, match="Failed to cast"):
+        env.array("NOT_A_NUMBER")
+
+
+def test_array_default(env):
+    assert env.array("NON_EXISTING_VAR", default=None) is None
+    assert env.array("NON_EXISTING_VAR", default=array("q", [1])) == array("q", [1])
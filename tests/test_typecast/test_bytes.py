@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_hex(set_env, env):
     set_env({"HEX_STRING": "01fe"})
     assert env.bytes("HEX_STRING", encoding="hex") == b"\x01\xfe"
@@ -11,3 +14,40 @@ def test_hex_prefix(set_env, env):
 def test_hex_no_leading_zero(set_env, env):
     set_env({"HEX_STRING": "1fe"})
     assert env.bytes("HEX_STRING", encoding="hex") == b"\x01\xfe"
+
+
+def test_hex_upper_case_prefix(set_env, env):
+    set_env({"HEX_STRING": "0X01FE"})
+    assert env.bytes("HEX_STRING", encoding="hex") == b"\x01\xfe"
+
+
+def test_base64(set_env, env):
+    set_env({"B64_STRING": "AP8+/w==", "B64URL_STRING": "AP8-_w", "B85_STRING": "0RKM!"})
+    assert env.bytes("B64_STRING", encoding="base64") == b"\x00\xff\x3e\xff"
+    assert env.bytes("B64URL_STRING", encoding="base64url") == b"\x00\xff\x3e\xff"
+    assert env.bytes("B85_STRING", encoding="base85") == b"\x00\xff\x3e\xff"
+
+
+def test_base64_invalid(set_env, env):
+    set_env({"B64_STRING": "AP8-_w=="})
+    with pytest.raises(Exception, match="Failed to cast"):
+        env.bytes("B64_STRING", encoding="base64")
+
+
+def test_unknown_encoding(set_env, env):
+    set_env({"HEX_STRING": "01"})
+    with pytest.raises(Exception, match="Failed to cast") as exc_info:
+        env.bytes("HEX_STRING", encoding="base32")
+    assert str(exc_info.value.__cause__) == 'Unknown encoding "base32"'
+
+
+def test_mutable(set_env, env):
+    set_env({"HEX_STRING": "01fe", "B64_STRING": "AP8="})
+    value = env.bytes("HEX_STRING", encoding="hex", mutable=True)
+    assert type(value) is bytearray
+    assert value == b"\x01\xfe"
+    value[:] = bytes(len(value))
+    assert value == b"\x00\x00"
+    value = env.bytes("B64_STRING", encoding="base64", mutable=True)
+    assert type(value) is bytearray
+    assert value == b"\x00\xff"
@@ -1,3 +1,13 @@
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import typenv
+from typenv import Env
+
+
 def test_json(set_env, env):
     set_env(
         {"VALID_JSON": '{"a": "x", "b": 1.2, "c": true, "d": null, "e": [2,3], "f": {"g": 0}}'}
@@ -20,3 +30,41 @@ def test_json_defaults(set_env, env):
     assert env.json("NON_EXISTING_VAR", default="a string") == "a string"
     assert env.json("NON_EXISTING_VAR", default=["a", "list"]) == ["a", "list"]
     assert env.json("NON_EXISTING_VAR", default={"a": "dict"}) == {"a": "dict"}
+
+
+def test_json_default_is_checked(set_env, env):
+    with pytest.raises(TypeError):
+        env.json("NON_EXISTING_VAR", default={"a": object()})
+    set_env({"VALID_JSON": "{}"})
+    with pytest.raises(TypeError):
+        env.json("VALID_JSON", default={"a": object()})
+
+
+def test_json_loads(set_env):
+    set_env({"VALID_JSON": "[1]"})
+    env = Env(json_loads=lambda s: ("custom", s))
+    assert env.json("VALID_JSON") == ("custom", "[1]")
+    assert env.load({"VALID_JSON": "json"}) == {"VALID_JSON": ("custom", "[1]")}
+
+
+@pytest.mark.parametrize(
+    "blocked_modules,expected_module",
+    [((), "orjson"), (("orjson",), "ujson"), (("orjson", "ujson"), "json")],
+)
+def test_default_json_loads(monkeypatch, blocked_modules, expected_module):
+    fake_modules = {"orjson": "orjson", "ujson": "ujson"}
+    for module_name, fake_module in fake_modules.items():
+        monkeypatch.setitem(
+            sys.modules,
+            module_name,
+            None if module_name in blocked_modules else SimpleNamespace(loads=fake_module),
+        )
+    typenv._default_json_loads.cache_clear()
+    try:
+        loads = typenv._default_json_loads()
+    finally:
+        typenv._default_json_loads.cache_clear()
+    if expected_module == "json":
+        assert loads is json.loads
+    else:
+        assert loads == expected_module
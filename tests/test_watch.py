@@ -0,0 +1,167 @@
+import os
+import threading
+from types import MappingProxyType
+
+import pytest
+
+from typenv import Env, ParsedValue
+
+
+@pytest.fixture
+def write_env(tmp_path):
+    path = tmp_path / ".env"
+    mtime_ns = 0
+
+    def _write_env(content):
+        nonlocal mtime_ns
+        path.write_text(content)
+        # Make each write visible to the watcher regardless of timestamp
+        # resolution
+        mtime_ns += 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return str(path)
+
+    return _write_env
+
+
+def test_watch(write_env):
+    path = write_env("AN_INT=1\nA_STR=a\nUNREAD=x\n")
+    source: dict[str, str] = {}
+    Env.read_env(path, target=source)
+    env = Env(source=source)
+    assert env.int("AN_INT") == 1
+    assert env.str("A_STR") == "a"
+    assert env.str("OPTIONAL", default=None) is None
+    scanner = Env(source=source)
+    assert scanner.scan("OPT") == {}
+    changes = []
+    watcher = env.watch(path, lambda *args: changes.append(args), interval=3600)
+    try:
+        watcher.check()
+        assert changes == []
+
+        write_env("AN_INT=2\nA_STR=a\nUNREAD=y\nOPTIONAL=${A_STR}b\n")
+        watcher.check()
+        assert sorted(changes) == [
+            ("AN_INT", ParsedValue(1, "int", False), ParsedValue(2, "int", False)),
+            ("OPTIONAL", ParsedValue(None, "str", True), ParsedValue("ab", "str", True)),
+        ]
+        assert source == {"AN_INT": "2", "A_STR": "a", "UNREAD": "y", "OPTIONAL": "ab"}
+        assert env.int("AN_INT") == 2
+        assert scanner.scan("OPT") == {"IONAL": "ab"}
+
+        changes.clear()
+        write_env("AN_INT=02\nA_STR=a\n")
+        watcher.check()
+        # AN_INT is re-read but its parsed value is unchanged
+        assert changes == [
+            ("OPTIONAL", ParsedValue("ab", "str", True), ParsedValue(None, "str", True))
+        ]
+        assert source == {"AN_INT": "02", "A_STR": "a"}
+    finally:
+        watcher.stop()
+
+
+def test_watch_error(write_env):
+    path = write_env("AN_INT=1\nA_STR=a\n")
+    source = {"AN_INT": "1", "A_STR": "a"}
+    env = Env(source=source)
+    env.int("AN_INT", validate=lambda v: v < 10)
+    env.str("A_STR")
+    errors = []
+    watcher = env.watch(path, on_error=lambda *args: errors.append(args), interval=3600)
+    write_env("AN_INT=10\n")
+    watcher.check()
+    watcher.stop()
+    assert [name for name, _ in sorted(errors)] == ["AN_INT", "A_STR"]
+    assert source == {"AN_INT": "1", "A_STR": "a"}
+    assert env.int("AN_INT") == 1
+
+
+def test_watch_error_ignored(write_env):
+    path = write_env("AN_INT=1\n")
+    env = Env(source={"AN_INT": "1"})
+    env.int("AN_INT")
+    watcher = env.watch(path, interval=3600)
+    write_env("AN_INT=x\n")
+    watcher.check()
+    watcher.stop()
+    assert env.int("AN_INT") == 1
+
+
+def test_watch_missing_file(tmp_path, write_env):
+    source = {"AN_INT": "1"}
+    env = Env(source=source)
+    env.int("AN_INT")
+    watcher = env.watch(str(tmp_path / ".env"), interval=3600, override=True)
+    watcher.check()
+    write_env("AN_INT=2\n")
+    watcher.check()
+    assert env.int("AN_INT") == 2
+    write_env("")
+    watcher.check()
+    watcher.stop()
+    assert env.int("AN_INT") == 1
+
+
+def test_watch_keeps_environment(write_env):
+    path = write_env("X=file1\nY=${X}\n")
+    source = {"X": "real"}
+    Env.read_env(path, target=source)
+    env = Env(source=source)
+    assert env.str("X") == "real"
+    assert env.str("Y", default=None) == "real"
+    watcher = env.watch(path, interval=3600)
+    write_env("X=file2\nY=${X}-2\n")
+    watcher.check()
+    assert source == {"X": "real", "Y": "real-2"}
+    write_env("")
+    watcher.check()
+    watcher.stop()
+    assert source == {"X": "real"}
+    assert env.str("X", default=None) == "real"
+
+
+def test_watch_from_file(tmp_path, write_env):
+    secret = tmp_path / "secret"
+    secret.write_text("s3cret")
+    path = write_env("DB_PASSWORD=fallback\n")
+    source = {"DB_PASSWORD_FILE": str(secret)}
+    Env.read_env(path, target=source)
+    env = Env(source=source)
+    assert env.str("DB_PASSWORD", from_file=True) == "s3cret"
+    changes = []
+    watcher = env.watch(path, lambda *args: changes.append(args), interval=3600)
+    write_env("DB_PASSWORD=fallback2\n")
+    watcher.check()
+    assert changes == []
+    assert env.str("DB_PASSWORD", from_file=True) == "s3cret"
+    del source["DB_PASSWORD_FILE"]
+    write_env("DB_PASSWORD=fallback3\n")
+    watcher.check()
+    watcher.stop()
+    assert changes == [
+        (
+            "DB_PASSWORD",
+            ParsedValue("s3cret", "str", False),
+            ParsedValue("fallback3", "str", False),
+        )
+    ]
+
+
+def test_watch_thread(write_env):
+    path = write_env("AN_INT=1\n")
+    env = Env(source={"AN_INT": "1"})
+    env.int("AN_INT")
+    changed = threading.Event()
+    watcher = env.watch(path, lambda *args: changed.set(), interval=0.01)
+    write_env("AN_INT=2\n")
+    assert changed.wait(10)
+    watcher.stop()
+    watcher.stop()
+    assert env.int("AN_INT") == 2
+
+
+def test_watch_immutable_source():
+    with pytest.raises(TypeError):
+        Env(source=MappingProxyType({})).watch()